@@ -7,6 +7,9 @@ Validates GenesisGraph workflows for FDA 21 CFR Part 11 compliance
 
 from typing import Any, Dict, List
 
+# Hash algorithm prefixes considered too weak for record integrity (§11.10(c))
+WEAK_HASH_PREFIXES = ('md5:', 'sha1:')
+
 
 class FDA21CFR11Validator:
     """
@@ -123,7 +126,7 @@ class FDA21CFR11Validator:
             if 'hash' in entity:
                 hash_val = entity['hash']
                 # Check for weak hash algorithms
-                if hash_val.startswith('md5:') or hash_val.startswith('sha1:'):
+                if hash_val.startswith(WEAK_HASH_PREFIXES):
                     self.warnings.append(
                         f"21 CFR §11.10(c): Entity '{entity.get('id')}' uses weak hash algorithm (md5/sha1). Use SHA-256 or stronger."
                     )
@@ -13,11 +13,15 @@ For production zero-knowledge range proofs, consider Bulletproofs or zkSNARKs.
 
 import hashlib
 import json
+import math
 import secrets
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
+# Size of the random salt mixed into each commitment (hex-encoded to 2x chars)
+_SALT_BYTES = 16
+
 
 class PredicateType(Enum):
     """Types of predicates supported"""
@@ -106,6 +110,25 @@ def create_predicate(
         assert proof.satisfied == True
         assert proof.disclosed_value is None  # Value not disclosed
     """
+    return _build_predicate(
+        claim_name,
+        actual_value,
+        predicate_type,
+        threshold,
+        disclose_value,
+        salt=secrets.token_hex(_SALT_BYTES),
+    )
+
+
+def _build_predicate(
+    claim_name: str,
+    actual_value: Any,
+    predicate_type: Union[PredicateType, str],
+    threshold: Any,
+    disclose_value: bool,
+    salt: str,
+) -> PredicateProof:
+    """Build a predicate proof using a caller-supplied commitment salt"""
     # Convert string to enum
     if isinstance(predicate_type, str):
         predicate_type = PredicateType(predicate_type)
@@ -114,7 +137,6 @@ def create_predicate(
     satisfied = _evaluate_predicate(actual_value, predicate_type, threshold)
 
     # Create commitment to actual value
-    salt = secrets.token_hex(16)
     commitment = _create_commitment(actual_value, salt)
 
     # Create proof
@@ -209,7 +231,7 @@ def create_range_proof(
         assert proof.satisfied == True
     """
     satisfied = min_value <= actual_value <= max_value
-    salt = secrets.token_hex(16)
+    salt = secrets.token_hex(_SALT_BYTES)
     commitment = _create_commitment(actual_value, salt)
 
     proof = PredicateProof(
@@ -254,12 +276,40 @@ def _create_commitment(value: Any, salt: str) -> str:
     Uses SHA-256 hash of (salt || value) to create a binding commitment.
     The salt prevents rainbow table attacks.
     """
-    value_str = json.dumps(value, sort_keys=True)
+    value_str = _canonical_value(value)
     commitment_input = f"{salt}:{value_str}"
     commitment = hashlib.sha256(commitment_input.encode()).hexdigest()
     return commitment
 
 
+def _canonical_value(value: Any) -> str:
+    """
+    Canonical string form of a committed value
+
+    Plain ints and finite floats take a fast path that produces exactly the
+    same text as ``json.dumps`` (which uses ``repr`` for both), so commitments
+    are unchanged. Everything else goes through ``json.dumps`` with sorted keys.
+    """
+    value_type = type(value)
+    if value_type is int or (value_type is float and math.isfinite(value)):
+        return repr(value)
+    return json.dumps(value, sort_keys=True)
+
+
+def _draw_salts(count: int) -> List[str]:
+    """
+    Draw ``count`` commitment salts from a single CSPRNG read
+
+    Equivalent to calling ``secrets.token_hex(16)`` ``count`` times, but pays
+    for one OS randomness call instead of one per salt.
+    """
+    pool = secrets.token_bytes(_SALT_BYTES * count)
+    return [
+        pool[i:i + _SALT_BYTES].hex()
+        for i in range(0, len(pool), _SALT_BYTES)
+    ]
+
+
 def batch_create_predicates(
     claims: Dict[str, Any],
     predicates: Dict[str, Dict[str, Any]],
@@ -288,21 +338,24 @@ def batch_create_predicates(
     disclose_values = disclose_values or []
     proofs = []
 
-    for claim_name, predicate_spec in predicates.items():
-        if claim_name not in claims:
-            continue
+    # Draw every salt up front rather than one CSPRNG call per claim
+    selected = [name for name in predicates if name in claims]
+    salts = _draw_salts(len(selected))
 
+    for claim_name, salt in zip(selected, salts):
+        predicate_spec = predicates[claim_name]
         actual_value = claims[claim_name]
         predicate_type = predicate_spec["type"]
         threshold = predicate_spec["threshold"]
         disclose = claim_name in disclose_values
 
-        proof = create_predicate(
+        proof = _build_predicate(
             claim_name=claim_name,
             actual_value=actual_value,
             predicate_type=predicate_type,
             threshold=threshold,
             disclose_value=disclose,
+            salt=salt,
         )
         proofs.append(proof)
 
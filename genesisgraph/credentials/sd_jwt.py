@@ -8,12 +8,18 @@ data elements to verifiers while maintaining cryptographic verification.
 Reference: https://datatracker.ietf.org/doc/html/draft-ietf-oauth-selective-disclosure-jwt
 """
 
+import base64
+import functools
+import hashlib
 import json
+import re
+import secrets
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
+    from cryptography.exceptions import InvalidSignature
     from jwcrypto import jwk, jwt
     from jwcrypto.common import json_encode
     from sd_jwt.common import SDObj
@@ -30,6 +36,155 @@ class SDJWTError(Exception):
     """Base exception for SD-JWT operations"""
 
 
+# Disclosure hashes are lowercase hex SHA-256 digests; anything else can be
+# rejected before hashing the disclosure
+_DISCLOSURE_HASH_PATTERN = re.compile(r'[0-9a-f]{64}')
+
+# Random bytes per disclosure salt (base64url-encoded to 22 characters)
+_SALT_BYTES = 16
+
+# Default JWS protected header for issued SD-JWTs
+_DEFAULT_HEADERS = {
+    "alg": "EdDSA",
+    "typ": "sd+jwt",
+}
+
+
+# JWS compact serialization: header.payload.signature, each base64url.
+# One fullmatch checks the segment count and alphabet in a single pass
+# (urlsafe_b64decode would otherwise silently skip stray characters).
+_JWS_COMPACT_PATTERN = re.compile(r'([A-Za-z0-9_-]+)\.([A-Za-z0-9_-]+)\.([A-Za-z0-9_-]*)')
+
+
+def _split_jws_compact(token: str) -> Tuple[str, str, str]:
+    """
+    Split a compact JWS into its header, payload and signature segments
+
+    Args:
+        token: Compact-serialized JWS
+
+    Returns:
+        Tuple of (header, payload, signature) base64url segments
+
+    Raises:
+        ValueError: If the token is not a well-formed compact JWS
+    """
+    match = _JWS_COMPACT_PATTERN.fullmatch(token)
+    if match is None:
+        raise ValueError("Token is not a compact JWS (expected 3 base64url segments)")
+    return match.group(1, 2, 3)
+
+
+def _decode_compact_jws(token: str) -> Tuple[Dict[str, Any], Dict[str, Any], bytes, bytes]:
+    """
+    Decode a compact JWS without checking its signature
+
+    Args:
+        token: Compact-serialized JWS
+
+    Returns:
+        Tuple of (header, claims, signing_input, signature)
+
+    Raises:
+        ValueError: If the token, header or payload is malformed
+    """
+    header_b64, payload_b64, signature_b64 = _split_jws_compact(token)
+    header = json.loads(_b64url_decode(header_b64))
+    if not isinstance(header, dict):
+        raise ValueError("Invalid JWS header")
+    claims = json.loads(_b64url_decode(payload_b64))
+    signing_input = f"{header_b64}.{payload_b64}".encode('ascii')
+    return header, claims, signing_input, _b64url_decode(signature_b64)
+
+
+def _b64url_encode(data: bytes) -> str:
+    """
+    Encode bytes as unpadded base64url text (JWS compact form)
+
+    Args:
+        data: Raw bytes
+
+    Returns:
+        base64url string without '=' padding
+    """
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """
+    Decode an unpadded base64url JWS segment
+
+    Args:
+        segment: base64url text with the trailing '=' padding stripped
+
+    Returns:
+        Decoded bytes
+    """
+    return base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4))
+
+
+def _draw_salts(count: int) -> List[str]:
+    """
+    Draw ``count`` disclosure salts from a single CSPRNG call
+
+    Each salt has the same form as ``secrets.token_urlsafe(_SALT_BYTES)``.
+
+    Args:
+        count: Number of salts to generate
+
+    Returns:
+        List of base64url salt strings
+    """
+    raw = secrets.token_bytes(_SALT_BYTES * count)
+    return [
+        _b64url_encode(raw[i:i + _SALT_BYTES])
+        for i in range(0, len(raw), _SALT_BYTES)
+    ]
+
+
+@functools.lru_cache(maxsize=32)
+def _load_verification_key(public_key_pem: str) -> Tuple[Any, Any]:
+    """
+    Parse a PEM public key once per distinct PEM
+
+    PEM parsing costs several times more than the Ed25519 check itself, and
+    holders typically present many tokens under the same issuer key.
+
+    Args:
+        public_key_pem: PEM-encoded public key
+
+    Returns:
+        Tuple of (jwcrypto JWK, cryptography Ed25519 key or None for other key types)
+    """
+    public_key = jwk.JWK.from_pem(public_key_pem.encode())
+    ed25519_key = None
+    if public_key.get('kty') == 'OKP' and public_key.get('crv') == 'Ed25519':
+        ed25519_key = public_key.get_op_key('verify')
+    return public_key, ed25519_key
+
+
+def _disclosure_hash(salt: str, claim_name: str, claim_value: Any) -> str:
+    """
+    Compute the hash commitment for a single disclosure
+
+    Shared by the issuer and verifier so both sides hash the exact same
+    bytes. The salt leads the hashed input, so there is no common prefix
+    to pre-seed across disclosures; one sha256 call per disclosure is the
+    whole cost, and hashlib already dispatches to the CPU's SHA extensions.
+
+    Args:
+        salt: Per-disclosure random salt
+        claim_name: Name of the claim
+        claim_value: JSON-serializable claim value
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    return hashlib.sha256(
+        f"{salt}{claim_name}{json.dumps(claim_value)}".encode()
+    ).hexdigest()
+
+
 class SDJWTIssuer:
     """
     SD-JWT Issuer for creating selective disclosure JWTs
@@ -65,6 +220,14 @@ class SDJWTIssuer:
             # Generate new Ed25519 key for testing
             self.private_key = jwk.JWK.generate(kty='OKP', crv='Ed25519')
 
+        # Ed25519 keys are signed with the underlying cryptography key object
+        # and a pre-encoded header, skipping the per-call jwcrypto JWT/JWS
+        # setup; other key types keep going through jwcrypto
+        self._signing_key = None
+        if self.private_key.get('kty') == 'OKP' and self.private_key.get('crv') == 'Ed25519':
+            self._signing_key = self.private_key.get_op_key('sign')
+        self._header_b64 = _b64url_encode(json_encode(_DEFAULT_HEADERS).encode())
+
     def create_sd_jwt(
         self,
         claims: Dict[str, Any],
@@ -90,11 +253,14 @@ class SDJWTIssuer:
                 - holder_jwt: Holder binding JWT (if holder_binding=True)
                 - issuer: Issuer DID
         """
-        if selectively_disclosable is None:
-            selectively_disclosable = []
-
-        # Prepare claims with selective disclosure markers
-        sd_claims = self._prepare_sd_claims(claims, selectively_disclosable)
+        if selectively_disclosable:
+            # Prepare claims with selective disclosure markers
+            sd_claims = self._prepare_sd_claims(claims, selectively_disclosable)
+            disclosures = self._generate_disclosures(claims, selectively_disclosable)
+        else:
+            # Plain signed JWT: every claim is disclosed, nothing to salt or hash
+            sd_claims = claims
+            disclosures = []
 
         # Create JWT payload
         now = int(time.time())
@@ -106,26 +272,34 @@ class SDJWTIssuer:
         }
 
         # Create JWT headers
-        headers = {
-            "alg": "EdDSA",
-            "typ": "sd+jwt",
-        }
+        headers = dict(_DEFAULT_HEADERS)
         if additional_headers:
             headers.update(additional_headers)
 
         # Sign the JWT
-        token = jwt.JWT(header=headers, claims=payload)
-        token.make_signed_token(self.private_key)
+        if self._signing_key is not None and headers["alg"] == "EdDSA":
+            header_b64 = (
+                _b64url_encode(json_encode(headers).encode())
+                if additional_headers else self._header_b64
+            )
+            signing_input = f"{header_b64}.{_b64url_encode(json_encode(payload).encode())}"
+            signature = self._signing_key.sign(signing_input.encode('ascii'))
+            sd_jwt_token = f"{signing_input}.{_b64url_encode(signature)}"
+        else:
+            token = jwt.JWT(header=headers, claims=payload)
+            token.make_signed_token(self.private_key)
+            sd_jwt_token = token.serialize()
 
         # Create SD-JWT structure
         # Note: This is a simplified implementation
         # The full sd-jwt library has more sophisticated disclosure handling
         result = {
-            "sd_jwt": token.serialize(),
-            "disclosures": self._generate_disclosures(claims, selectively_disclosable),
+            "sd_jwt": sd_jwt_token,
+            "disclosures": disclosures,
             "issuer": self.issuer_did,
             "algorithm": "EdDSA",
-            "created": datetime.utcnow().isoformat() + "Z",
+            # Same clock reading as iat, formatted without a datetime object
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)),
         }
 
         if holder_binding:
@@ -144,9 +318,10 @@ class SDJWTIssuer:
         For selectively disclosable claims, we use hash-based disclosure.
         """
         sd_claims = {}
+        disclosable = set(selectively_disclosable)
 
         for key, value in claims.items():
-            if key in selectively_disclosable:
+            if key in disclosable:
                 # Mark as selectively disclosable
                 # In production, this would be a hash commitment
                 sd_claims[f"_sd_{key}"] = {
@@ -172,22 +347,18 @@ class SDJWTIssuer:
         - claim_value: Value of the claim
         - salt: Random salt for hash commitment
         """
-        import hashlib
-        import secrets
+        disclosed_keys = [key for key in selectively_disclosable if key in claims]
+        salts = _draw_salts(len(disclosed_keys))
 
         disclosures = []
-        for key in selectively_disclosable:
-            if key in claims:
-                salt = secrets.token_urlsafe(16)
-                disclosure = {
-                    "claim_name": key,
-                    "claim_value": claims[key],
-                    "salt": salt,
-                    "hash": hashlib.sha256(
-                        f"{salt}{key}{json.dumps(claims[key])}".encode()
-                    ).hexdigest()
-                }
-                disclosures.append(disclosure)
+        for key, salt in zip(disclosed_keys, salts):
+            disclosure = {
+                "claim_name": key,
+                "claim_value": claims[key],
+                "salt": salt,
+                "hash": _disclosure_hash(salt, key, claims[key])
+            }
+            disclosures.append(disclosure)
 
         return disclosures
 
@@ -213,7 +384,8 @@ class SDJWTVerifier:
         Args:
             trusted_issuers: List of trusted issuer DIDs (if None, trusts all)
         """
-        self.trusted_issuers = set(trusted_issuers) if trusted_issuers else None
+        # Frozen so the allow-list cannot drift after construction
+        self.trusted_issuers = frozenset(trusted_issuers) if trusted_issuers else None
 
     def verify_sd_jwt(
         self,
@@ -258,15 +430,33 @@ class SDJWTVerifier:
 
             # Verify JWT signature
             if public_key_pem:
-                public_key = jwk.JWK.from_pem(public_key_pem.encode())
-                token = jwt.JWT(jwt=sd_jwt_token, key=public_key)
-                claims = json.loads(token.claims)
+                public_key, ed25519_key = _load_verification_key(public_key_pem)
+                if ed25519_key is not None:
+                    # Check the Ed25519 signature directly with the
+                    # cryptography key rather than through a jwcrypto JWT
+                    header, claims, signing_input, signature = _decode_compact_jws(sd_jwt_token)
+                    if header.get('alg') != 'EdDSA':
+                        raise ValueError(f"Unexpected JWS algorithm for Ed25519 key: {header.get('alg')}")
+                    # jwcrypto implements no critical extensions, so it
+                    # rejects every crit header; do the same here
+                    if 'crit' in header:
+                        raise ValueError("Unsupported critical JWS header parameters")
+                    try:
+                        ed25519_key.verify(signature, signing_input)
+                    except InvalidSignature:
+                        raise ValueError("Invalid JWS signature") from None
+                else:
+                    # Timestamps are checked below against current_time for
+                    # every key type, not against the wall clock here
+                    token = jwt.JWT(jwt=sd_jwt_token, key=public_key, check_claims=False)
+                    claims = json.loads(token.claims)
             else:
                 # For testing, decode without verification
                 # In production, ALWAYS verify signature
-                token = jwt.JWT(jwt=sd_jwt_token)
-                token.token.objects['valid'] = True  # Skip signature check for demo
-                claims = json.loads(token.token.payload.decode())
+                # Without a key there is nothing for jwcrypto to check, so
+                # decode the compact segments directly instead of building
+                # (and deep-copying) a JWT object just to read the payload
+                _, claims, _, _ = _decode_compact_jws(sd_jwt_token)
 
             # Validate timestamps
             current_time = current_time or int(time.time())
@@ -274,15 +464,20 @@ class SDJWTVerifier:
                 errors.append("JWT expired")
             if "iat" in claims and claims["iat"] > current_time + 60:
                 errors.append("JWT issued in the future")
+            if "nbf" in claims and claims["nbf"] > current_time + 60:
+                errors.append("JWT not yet valid")
 
             # Process disclosed claims
             if disclosed_claims:
+                # Index disclosures by claim name once (first one wins, as
+                # with a linear search) instead of rescanning per claim
+                disclosures_by_name = {}
+                for d in disclosures:
+                    disclosures_by_name.setdefault(d["claim_name"], d)
+
                 for claim_name in disclosed_claims:
                     # Find matching disclosure
-                    disclosure = next(
-                        (d for d in disclosures if d["claim_name"] == claim_name),
-                        None
-                    )
+                    disclosure = disclosures_by_name.get(claim_name)
                     if disclosure:
                         disclosed_data[claim_name] = disclosure["claim_value"]
                     else:
@@ -329,10 +524,13 @@ class SDJWTVerifier:
         Returns:
             True if disclosure is valid
         """
-        import hashlib
+        if not isinstance(expected_hash, str) or not _DISCLOSURE_HASH_PATTERN.fullmatch(expected_hash):
+            return False
 
-        computed_hash = hashlib.sha256(
-            f"{disclosure['salt']}{disclosure['claim_name']}{json.dumps(disclosure['claim_value'])}".encode()
-        ).hexdigest()
+        computed_hash = _disclosure_hash(
+            disclosure['salt'],
+            disclosure['claim_name'],
+            disclosure['claim_value']
+        )
 
         return computed_hash == expected_hash
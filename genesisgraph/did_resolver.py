@@ -19,6 +19,8 @@ References:
 
 import base64
 import json
+import socket
+from bisect import bisect_right
 from time import time
 from typing import Dict, List, Optional, Tuple
 
@@ -52,6 +54,7 @@ BLOCKED_HOSTS = {
 
 # Private network ranges to block
 BLOCKED_NETWORKS = [
+    '0.0.0.0/8',       # "This network" (0.0.0.0 reaches localhost on many systems)
     '10.0.0.0/8',      # Private network (Class A)
     '172.16.0.0/12',   # Private network (Class B)
     '192.168.0.0/16',  # Private network (Class C)
@@ -62,11 +65,58 @@ BLOCKED_NETWORKS = [
     '::1/128',         # IPv6 loopback
 ]
 
+
+def _build_blocked_ranges(networks: List[str]) -> Dict[int, Tuple[List[int], List[int]]]:
+    """
+    Compile CIDR blocks into sorted, merged integer ranges per IP version
+
+    Lets _is_blocked_host test an address with one binary search instead of
+    parsing and scanning every network on each call.
+
+    Args:
+        networks: CIDR strings (IPv4 and/or IPv6)
+
+    Returns:
+        Mapping of IP version to (range starts, range ends), sorted by start
+    """
+    intervals: Dict[int, List[Tuple[int, int]]] = {4: [], 6: []}
+    for network_str in networks:
+        network = ipaddress.ip_network(network_str)
+        intervals[network.version].append(
+            (int(network.network_address), int(network.broadcast_address))
+        )
+
+    ranges = {}
+    for version, spans in intervals.items():
+        starts: List[int] = []
+        ends: List[int] = []
+        for start, end in sorted(spans):
+            # Merge overlapping/adjacent blocks so a single lookup is exact
+            if ends and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        ranges[version] = (starts, ends)
+    return ranges
+
+
+_BLOCKED_RANGES = _build_blocked_ranges(BLOCKED_NETWORKS) if IPADDRESS_AVAILABLE else {}
+
 # Security: Input size limits
 MAX_BASE58_LENGTH = 128  # Maximum base58 string length to prevent DoS
 MAX_DID_LENGTH = 512     # Maximum DID length
 MAX_RESPONSE_SIZE = 1_000_000  # 1MB max for DID documents
 
+# Bitcoin-style base58 alphabet, as a digit-value lookup for decoding
+_BASE58_VALUES = {
+    char: value
+    for value, char in enumerate('123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz')
+}
+# 58**10 < 2**64, so ten digits fit a machine-word accumulator
+_BASE58_CHUNK_DIGITS = 10
+_BASE58_POWERS = [58 ** n for n in range(_BASE58_CHUNK_DIGITS + 1)]
+
 # Default resolver endpoints for did:ion and did:ethr
 DEFAULT_ION_RESOLVER = "https://ion.tbd.website/identifiers/"
 DEFAULT_ETHR_RESOLVER = "https://dev.uniresolver.io/1.0/identifiers/"
@@ -132,8 +182,9 @@ class DIDResolver:
 
         # Check cache with TTL
         cache_key = f"{did}#{key_id}" if key_id else did
-        if cache_key in self._cache:
-            cached_value, cached_time = self._cache[cache_key]
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            cached_value, cached_time = cached
             # Check if cache entry is still valid
             if time() - cached_time < self.cache_ttl:
                 return cached_value
@@ -235,21 +286,33 @@ class DIDResolver:
         Returns:
             True if blocked, False if allowed
         """
-        # Check against blocked hostnames
-        if domain.lower() in BLOCKED_HOSTS:
+        # Check against blocked hostnames ("localhost." is the same host)
+        host = domain.lower().rstrip('.')
+        if host in BLOCKED_HOSTS:
             return True
 
         # Check if it's an IP address in a blocked network
         if IPADDRESS_AVAILABLE:
             try:
-                ip = ipaddress.ip_address(domain)
-                for network_str in BLOCKED_NETWORKS:
-                    network = ipaddress.ip_network(network_str)
-                    if ip in network:
-                        return True
+                ip = ipaddress.ip_address(host)
             except ValueError:
-                # Not an IP address, domain name is OK (will be resolved by DNS)
-                pass
+                # Legacy IPv4 spellings (0x7f000001, 2130706433, 0177.0.0.1,
+                # 127.1) are rejected by ipaddress but still accepted by the
+                # system resolver, so normalise them the same way it does
+                try:
+                    ip = ipaddress.IPv4Address(socket.inet_aton(host))
+                except OSError:
+                    # Not an IP address, domain name is OK (will be resolved by DNS)
+                    return False
+
+            if ip.version == 6 and ip.ipv4_mapped is not None:
+                ip = ip.ipv4_mapped
+
+            starts, ends = _BLOCKED_RANGES[ip.version]
+            value = int(ip)
+            index = bisect_right(starts, value) - 1
+            if index >= 0 and value <= ends[index]:
+                return True
 
         return False
 
@@ -285,6 +348,24 @@ class DIDResolver:
         # Record this request
         self._rate_limits[domain].append(now)
 
+    @staticmethod
+    def _check_response_size(response: "requests.Response", url: str) -> None:
+        """
+        Reject responses larger than MAX_RESPONSE_SIZE
+
+        Args:
+            response: HTTP response from the resolver endpoint
+            url: Requested URL (for error messages)
+
+        Raises:
+            ValidationError: If the response exceeds the size limit
+        """
+        if len(response.content) > MAX_RESPONSE_SIZE:
+            raise ValidationError(
+                f"Response too large from {url}: {len(response.content)} bytes "
+                f"(max {MAX_RESPONSE_SIZE})"
+            )
+
     def _resolve_did_web(self, did: str, key_id: Optional[str] = None) -> bytes:
         """
         Resolve did:web by fetching DID document via HTTPS
@@ -365,11 +446,7 @@ class DIDResolver:
                 )
 
             # Security: Validate response size
-            if len(response.content) > MAX_RESPONSE_SIZE:
-                raise ValidationError(
-                    f"Response too large from {url}: {len(response.content)} bytes "
-                    f"(max {MAX_RESPONSE_SIZE})"
-                )
+            self._check_response_size(response, url)
 
             did_document = response.json()
 
@@ -448,11 +525,7 @@ class DIDResolver:
                 )
 
             # Security: Validate response size
-            if len(response.content) > MAX_RESPONSE_SIZE:
-                raise ValidationError(
-                    f"Response too large from {url}: {len(response.content)} bytes "
-                    f"(max {MAX_RESPONSE_SIZE})"
-                )
+            self._check_response_size(response, url)
 
             # ION resolver returns a resolution result with didDocument nested
             response_data = response.json()
@@ -544,11 +617,7 @@ class DIDResolver:
                 )
 
             # Security: Validate response size
-            if len(response.content) > MAX_RESPONSE_SIZE:
-                raise ValidationError(
-                    f"Response too large from {url}: {len(response.content)} bytes "
-                    f"(max {MAX_RESPONSE_SIZE})"
-                )
+            self._check_response_size(response, url)
 
             # Universal Resolver returns a resolution result with didDocument nested
             response_data = response.json()
@@ -660,15 +729,19 @@ class DIDResolver:
         if len(s) > MAX_BASE58_LENGTH:
             raise ValueError(f"Base58 string too long: {len(s)} (max {MAX_BASE58_LENGTH})")
 
-        # Bitcoin-style base58 alphabet
-        ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-
-        # Convert base58 string to integer
+        # Convert base58 string to integer. Digits are folded into a
+        # machine-word accumulator ten at a time, so the big integer is
+        # only multiplied once per chunk rather than once per character.
         num = 0
-        for char in s:
-            if char not in ALPHABET:
-                raise ValueError(f"Invalid base58 character: {char}")
-            num = num * 58 + ALPHABET.index(char)
+        for start in range(0, len(s), _BASE58_CHUNK_DIGITS):
+            chunk = s[start:start + _BASE58_CHUNK_DIGITS]
+            acc = 0
+            for char in chunk:
+                value = _BASE58_VALUES.get(char)
+                if value is None:
+                    raise ValueError(f"Invalid base58 character: {char}")
+                acc = acc * 58 + value
+            num = num * _BASE58_POWERS[len(chunk)] + acc
 
         # Security: Sanity check decoded size (prevent integer overflow)
         # Max reasonable size for a key is ~1024 bits = 128 bytes
@@ -680,17 +753,9 @@ class DIDResolver:
         # Count leading zeros
         leading_zeros = len(s) - len(s.lstrip('1'))
 
-        # Convert number to bytes
-        if num == 0:
-            return b'\x00' * leading_zeros
-
-        bytes_list = []
-        while num > 0:
-            num, remainder = divmod(num, 256)
-            bytes_list.insert(0, remainder)
-
-        # Add leading zero bytes
-        return b'\x00' * leading_zeros + bytes(bytes_list)
+        # Convert number to bytes (zero encodes to no bytes) and add
+        # leading zero bytes
+        return b'\x00' * leading_zeros + num.to_bytes((num.bit_length() + 7) // 8, 'big')
 
     def clear_cache(self):
         """Clear the DID resolution cache"""
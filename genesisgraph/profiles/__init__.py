@@ -4,7 +4,7 @@ GenesisGraph Profile Validators
 Industry-specific profile validators for automated compliance checking.
 """
 
-from .base import BaseProfileValidator, ProfileValidationResult
+from .base import BaseProfileValidator, ProfileIssue, ProfileValidationResult
 from .registry import ProfileRegistry
 
-__all__ = ['BaseProfileValidator', 'ProfileValidationResult', 'ProfileRegistry']
+__all__ = ['BaseProfileValidator', 'ProfileIssue', 'ProfileValidationResult', 'ProfileRegistry']
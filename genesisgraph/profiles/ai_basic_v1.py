@@ -7,7 +7,7 @@ and regulatory requirements (FDA 21 CFR Part 11, etc.).
 
 from typing import Dict, List
 
-from .base import BaseProfileValidator
+from .base import BaseProfileValidator, ProfileIssue
 
 
 class AIBasicV1Validator(BaseProfileValidator):
@@ -55,6 +55,13 @@ class AIBasicV1Validator(BaseProfileValidator):
         'ai_inference',  # When used for high-stakes decisions
     }
 
+    # AI operations that should carry an attestation
+    ATTESTATION_RECOMMENDED = {
+        'ai_inference',
+        'ai_training',
+        'ai_moderation'
+    }
+
     # Allowed tool types for AI operations
     ALLOWED_TOOL_TYPES = {
         'AIModel',
@@ -74,11 +81,9 @@ class AIBasicV1Validator(BaseProfileValidator):
         """Validate AI-specific operation requirements"""
         errors = []
 
-        # Track if we have human review in the workflow
-        has_human_review = any(
-            op.get('type') == 'human_review'
-            for op in operations
-        )
+        # Any human_review operation in the workflow satisfies the review
+        # recommendation, so check for one once rather than per operation
+        has_human_review = any(op.get('type') == 'human_review' for op in operations)
 
         for op in operations:
             op_type = op.get('type')
@@ -86,39 +91,48 @@ class AIBasicV1Validator(BaseProfileValidator):
 
             # Check required parameters for AI operations
             if op_type in self.REQUIRED_PARAMS:
-                required = self.REQUIRED_PARAMS[op_type]
-                param_errors = self._check_required_parameters(op, required)
-                errors.extend(param_errors)
-
-                # Validate specific parameter values
+                # Redacted parameters (privacy-preserving mode) skip every
+                # parameter check, so test for redaction once up front
                 parameters = op.get('parameters', {})
                 if not parameters.get('_redacted'):
+                    # Only walk the ordered list (for messages) if something is missing
+                    if not parameters.keys() >= self._REQUIRED_PARAM_SETS[op_type]:
+                        required = self.REQUIRED_PARAMS[op_type]
+                        param_errors = self._check_required_parameters(
+                            op, required, allow_redacted=False
+                        )
+                        errors.extend(param_errors)
+
+                    # Validate specific parameter values
                     # Temperature should be between 0 and 2
                     if 'temperature' in parameters:
                         temp = parameters['temperature']
                         if not isinstance(temp, (int, float)) or temp < 0 or temp > 2:
-                            errors.append(
+                            errors.append(ProfileIssue(
+                                'parameter_out_of_range',
                                 f"Operation '{op_id}': temperature must be between 0 and 2, got {temp}"
-                            )
+                            ))
 
                     # Top_p should be between 0 and 1
                     if 'top_p' in parameters:
                         top_p = parameters['top_p']
                         if not isinstance(top_p, (int, float)) or top_p < 0 or top_p > 1:
-                            errors.append(
+                            errors.append(ProfileIssue(
+                                'parameter_out_of_range',
                                 f"Operation '{op_id}': top_p must be between 0 and 1, got {top_p}"
-                            )
+                            ))
 
                     # Similarity threshold should be between 0 and 1
                     if 'similarity_threshold' in parameters:
                         threshold = parameters['similarity_threshold']
                         if not isinstance(threshold, (int, float)) or threshold < 0 or threshold > 1:
-                            errors.append(
+                            errors.append(ProfileIssue(
+                                'parameter_out_of_range',
                                 f"Operation '{op_id}': similarity_threshold must be between 0 and 1, got {threshold}"
-                            )
+                            ))
 
             # Check attestation requirements for AI operations
-            if op_type in ['ai_inference', 'ai_training', 'ai_moderation']:
+            if op_type in self.ATTESTATION_RECOMMENDED:
                 attestation = op.get('attestation')
                 if not attestation:
                     self.warnings.append(
@@ -134,17 +148,11 @@ class AIBasicV1Validator(BaseProfileValidator):
                         self.warnings.append(error.replace("not allowed", "recommended"))
 
             # Check for human review requirement
-            if op_type in self.HUMAN_REVIEW_REQUIRED:
-                # Check if this operation's outputs go to a human review
-                outputs = op.get('outputs', [])
-                has_review_downstream = self._check_human_review_downstream(
-                    outputs, operations
+            if op_type in self.HUMAN_REVIEW_REQUIRED and not has_human_review:
+                self.warnings.append(
+                    f"Operation '{op_id}': AI inference operations should include "
+                    f"human review for high-stakes decisions (FDA 21 CFR Part 11)"
                 )
-                if not has_review_downstream and not has_human_review:
-                    self.warnings.append(
-                        f"Operation '{op_id}': AI inference operations should include "
-                        f"human review for high-stakes decisions (FDA 21 CFR Part 11)"
-                    )
 
         return errors
 
@@ -160,9 +168,10 @@ class AIBasicV1Validator(BaseProfileValidator):
 
             # AI models should have version information
             if 'version' not in model:
-                errors.append(
+                errors.append(ProfileIssue(
+                    'missing_version',
                     f"Tool '{model_id}': AIModel tools must specify version for reproducibility"
-                )
+                ))
 
             # AI models should have identity (DID or URI)
             if 'did' not in model and 'uri' not in model:
@@ -184,16 +193,18 @@ class AIBasicV1Validator(BaseProfileValidator):
             # Datasets should have hash for integrity
             if entity_type == 'Dataset':
                 if 'hash' not in entity:
-                    errors.append(
+                    errors.append(ProfileIssue(
+                        'missing_hash',
                         f"Entity '{entity_id}': Dataset entities must have 'hash' for data integrity (FDA 21 CFR Part 11)"
-                    )
+                    ))
 
             # AI Models should have version and hash
             if entity_type == 'Model':
                 if 'version' not in entity:
-                    errors.append(
+                    errors.append(ProfileIssue(
+                        'missing_version',
                         f"Entity '{entity_id}': Model entities must have 'version' for reproducibility"
-                    )
+                    ))
                 if 'hash' not in entity:
                     self.warnings.append(
                         f"Entity '{entity_id}': Model entities should have 'hash' for integrity verification"
@@ -201,31 +212,6 @@ class AIBasicV1Validator(BaseProfileValidator):
 
         return errors
 
-    def _check_human_review_downstream(
-        self,
-        outputs: List[str],
-        operations: List[Dict]
-    ) -> bool:
-        """
-        Check if any of the outputs flow to a human_review operation
-
-        Args:
-            outputs: List of output entity IDs
-            operations: All operations in the workflow
-
-        Returns:
-            True if human review is found downstream
-        """
-        # Build a graph of entity flows
-        for op in operations:
-            if op.get('type') == 'human_review':
-                inputs = op.get('inputs', [])
-                # Check if any of our outputs are inputs to human review
-                if any(output_id in inputs for output_id in outputs):
-                    return True
-
-        return False
-
     def _validate_custom(self, data: Dict) -> List[str]:
         """Custom validation for AI workflows"""
         errors = []
@@ -247,16 +233,18 @@ class AIBasicV1Validator(BaseProfileValidator):
             if 'bias_assessment' in responsible_ai:
                 bias = responsible_ai['bias_assessment']
                 if not isinstance(bias, dict):
-                    errors.append(
+                    errors.append(ProfileIssue(
+                        'invalid_metadata',
                         "metadata.responsible_ai.bias_assessment must be an object"
-                    )
+                    ))
 
             # Validate fairness metrics
             if 'fairness_metrics' in responsible_ai:
                 fairness = responsible_ai['fairness_metrics']
                 if not isinstance(fairness, dict):
-                    errors.append(
+                    errors.append(ProfileIssue(
+                        'invalid_metadata',
                         "metadata.responsible_ai.fairness_metrics must be an object"
-                    )
+                    ))
 
         return errors
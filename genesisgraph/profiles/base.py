@@ -6,18 +6,62 @@ Provides the base class and interface for industry-specific profile validators.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, FrozenSet, List, Set, Tuple
+
+
+class ProfileIssue(str):
+    """
+    A profile validation message tagged with a machine-readable code
+
+    Behaves exactly like the message string (substring checks, joins and
+    JSON output are unchanged) while exposing ``code`` so callers can test
+    for a category of error with ProfileValidationResult.has_error()
+    instead of scanning message text.
+
+    Codes used by the built-in profiles:
+        missing_parameter, parameter_out_of_range, missing_hash,
+        missing_version, missing_identity, missing_attestation,
+        attestation_mode_not_allowed, tool_type_not_allowed,
+        invalid_metadata, unknown_profile
+    """
+
+    code: str
+
+    def __new__(cls, code: str, message: str) -> "ProfileIssue":
+        issue = super().__new__(cls, message)
+        issue.code = code
+        return issue
+
+    def __getnewargs__(self) -> Tuple[str, str]:  # type: ignore[override]
+        return (self.code, str(self))
 
 
 @dataclass
 class ProfileValidationResult:
     """Result of profile validation"""
+    __slots__ = ('is_valid', 'errors', 'warnings', 'profile_id', 'profile_version')
+
     is_valid: bool
     errors: List[str]
     warnings: List[str]
     profile_id: str
     profile_version: str
 
+    @property
+    def error_codes(self) -> FrozenSet[str]:
+        """ProfileIssue codes among the current errors"""
+        # Derived on access: callers may still append to errors after the
+        # result is built
+        return frozenset(
+            error.code for error in self.errors if isinstance(error, ProfileIssue)
+        )
+
+    def has_error(self, code: str) -> bool:
+        """Check whether any error carries the given ProfileIssue code"""
+        return any(
+            isinstance(error, ProfileIssue) and error.code == code for error in self.errors
+        )
+
     def format_report(self) -> str:
         """Format validation result as a human-readable report"""
         lines = [
@@ -59,17 +103,36 @@ class BaseProfileValidator(ABC):
     profile_id: str = "base"
     profile_version: str = "1.0.0"
 
+    # Frozenset view of a subclass's REQUIRED_PARAMS, rebuilt per subclass so
+    # "all required parameters present" is a single subset test
+    _REQUIRED_PARAM_SETS: Dict[str, FrozenSet[str]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        required_params = getattr(cls, 'REQUIRED_PARAMS', {})
+        cls._REQUIRED_PARAM_SETS = {
+            op_type: frozenset(params) for op_type, params in required_params.items()
+        }
+
     def __init__(self):
         """Initialize the profile validator"""
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
-    def validate_profile(self, data: Dict[str, Any]) -> ProfileValidationResult:
+    def validate_profile(
+        self,
+        data: Dict[str, Any],
+        fail_fast: bool = False
+    ) -> ProfileValidationResult:
         """
         Main validation entry point
 
         Args:
             data: Parsed GenesisGraph document
+            fail_fast: If True, stop after the first validation stage
+                       (entities, operations, tools, custom) that reports
+                       errors. Useful for callers that only need is_valid;
+                       the result then holds only that stage's errors.
 
         Returns:
             ProfileValidationResult with validation details
@@ -82,27 +145,56 @@ class BaseProfileValidator(ABC):
         if entities:
             entity_errors = self._validate_entities(entities)
             self.errors.extend(entity_errors)
+            if fail_fast and self.errors:
+                return self._build_result()
 
         # Validate operations
         operations = data.get('operations', [])
         if operations:
             op_errors = self._validate_operations(operations)
             self.errors.extend(op_errors)
+            if fail_fast and self.errors:
+                return self._build_result()
 
         # Validate tools
         tools = data.get('tools', [])
         if tools:
             tool_errors = self._validate_tools(tools)
             self.errors.extend(tool_errors)
+            if fail_fast and self.errors:
+                return self._build_result()
 
         # Run custom validation logic
         custom_errors = self._validate_custom(data)
         self.errors.extend(custom_errors)
 
-        is_valid = len(self.errors) == 0
+        return self._build_result()
+
+    def validate_profiles(
+        self,
+        documents: List[Dict[str, Any]],
+        fail_fast: bool = False
+    ) -> List[ProfileValidationResult]:
+        """
+        Validate many documents with one validator instance
+
+        Reuses this instance (and its per-subclass lookup tables) for every
+        document instead of constructing a validator per workflow.
+
+        Args:
+            documents: Parsed GenesisGraph documents
+            fail_fast: Passed through to validate_profile()
+
+        Returns:
+            One ProfileValidationResult per document, in input order
+        """
+        validate = self.validate_profile
+        return [validate(data, fail_fast) for data in documents]
 
+    def _build_result(self) -> ProfileValidationResult:
+        """Package the accumulated errors and warnings into a result"""
         return ProfileValidationResult(
-            is_valid=is_valid,
+            is_valid=len(self.errors) == 0,
             errors=self.errors,
             warnings=self.warnings,
             profile_id=self.profile_id,
@@ -185,10 +277,11 @@ class BaseProfileValidator(ABC):
         # Check for required parameters
         for param in required_params:
             if param not in parameters:
-                errors.append(
+                errors.append(ProfileIssue(
+                    'missing_parameter',
                     f"Operation '{op_id}': missing required parameter '{param}' "
                     f"for profile {self.profile_id}"
-                )
+                ))
 
         return errors
 
@@ -208,10 +301,11 @@ class BaseProfileValidator(ABC):
         tool_type = tool.get('type')
 
         if tool_type and tool_type not in allowed_types:
-            errors.append(
+            errors.append(ProfileIssue(
+                'tool_type_not_allowed',
                 f"Tool '{tool_id}': type '{tool_type}' not allowed by profile {self.profile_id}. "
                 f"Allowed types: {', '.join(sorted(allowed_types))}"
-            )
+            ))
 
         return errors
 
@@ -236,9 +330,10 @@ class BaseProfileValidator(ABC):
         mode = attestation.get('mode')
 
         if mode and mode not in required_modes:
-            errors.append(
+            errors.append(ProfileIssue(
+                'attestation_mode_not_allowed',
                 f"Operation '{op_id}': attestation mode '{mode}' not allowed by profile {self.profile_id}. "
                 f"Required modes: {', '.join(sorted(required_modes))}"
-            )
+            ))
 
         return errors
@@ -7,7 +7,7 @@ and industry best practices.
 
 from typing import Dict, List
 
-from .base import BaseProfileValidator
+from .base import BaseProfileValidator, ProfileIssue
 
 
 class CAMv1Validator(BaseProfileValidator):
@@ -66,6 +66,13 @@ class CAMv1Validator(BaseProfileValidator):
         'quality_inspection'
     }
 
+    # Critical operations that must carry an attestation (ISO-9001)
+    ATTESTATION_REQUIRED = {
+        'cnc_machining',
+        'additive_manufacturing',
+        'quality_inspection'
+    }
+
     # Allowed tool types for manufacturing
     ALLOWED_TOOL_TYPES = {
         'Machine',
@@ -100,44 +107,54 @@ class CAMv1Validator(BaseProfileValidator):
 
             # Check required parameters for manufacturing operations
             if op_type in self.REQUIRED_PARAMS:
-                required = self.REQUIRED_PARAMS[op_type]
-                param_errors = self._check_required_parameters(op, required)
-                errors.extend(param_errors)
-
-                # Validate specific parameter values
+                # Redacted parameters (privacy-preserving mode) skip every
+                # parameter check, so test for redaction once up front
                 parameters = op.get('parameters', {})
                 if not parameters.get('_redacted'):
+                    # Only walk the ordered list (for messages) if something is missing
+                    if not parameters.keys() >= self._REQUIRED_PARAM_SETS[op_type]:
+                        required = self.REQUIRED_PARAMS[op_type]
+                        param_errors = self._check_required_parameters(
+                            op, required, allow_redacted=False
+                        )
+                        errors.extend(param_errors)
+
+                    # Validate specific parameter values
                     # Tolerance must be positive
                     if 'tolerance_mm' in parameters:
                         tolerance = parameters['tolerance_mm']
                         if not isinstance(tolerance, (int, float)) or tolerance <= 0:
-                            errors.append(
+                            errors.append(ProfileIssue(
+                                'parameter_out_of_range',
                                 f"Operation '{op_id}': tolerance_mm must be a positive number, got {tolerance}"
-                            )
+                            ))
 
                     # Feed rate must be positive
                     if 'feed_rate_mm_per_min' in parameters:
                         feed_rate = parameters['feed_rate_mm_per_min']
                         if not isinstance(feed_rate, (int, float)) or feed_rate <= 0:
-                            errors.append(
+                            errors.append(ProfileIssue(
+                                'parameter_out_of_range',
                                 f"Operation '{op_id}': feed_rate_mm_per_min must be positive, got {feed_rate}"
-                            )
+                            ))
 
                     # Spindle speed must be positive
                     if 'spindle_speed_rpm' in parameters:
                         speed = parameters['spindle_speed_rpm']
                         if not isinstance(speed, (int, float)) or speed <= 0:
-                            errors.append(
+                            errors.append(ProfileIssue(
+                                'parameter_out_of_range',
                                 f"Operation '{op_id}': spindle_speed_rpm must be positive, got {speed}"
-                            )
+                            ))
 
                     # Layer height must be positive
                     if 'layer_height_mm' in parameters:
                         layer_height = parameters['layer_height_mm']
                         if not isinstance(layer_height, (int, float)) or layer_height <= 0:
-                            errors.append(
+                            errors.append(ProfileIssue(
+                                'parameter_out_of_range',
                                 f"Operation '{op_id}': layer_height_mm must be positive, got {layer_height}"
-                            )
+                            ))
 
                     # Temperature must be reasonable (0-500°C for most processes)
                     if 'temperature_celsius' in parameters:
@@ -151,9 +168,10 @@ class CAMv1Validator(BaseProfileValidator):
                     if 'infill_percent' in parameters:
                         infill = parameters['infill_percent']
                         if not isinstance(infill, (int, float)) or infill < 0 or infill > 100:
-                            errors.append(
+                            errors.append(ProfileIssue(
+                                'parameter_out_of_range',
                                 f"Operation '{op_id}': infill_percent must be between 0 and 100, got {infill}"
-                            )
+                            ))
 
             # Check calibration requirements
             if op_type in self.CALIBRATION_REQUIRED:
@@ -163,18 +181,20 @@ class CAMv1Validator(BaseProfileValidator):
                     self._add_calibration_warning(op_id, tool_ref)
 
             # Check attestation for critical operations
-            if op_type in ['cnc_machining', 'additive_manufacturing', 'quality_inspection']:
+            if op_type in self.ATTESTATION_REQUIRED:
                 attestation = op.get('attestation')
                 if not attestation:
-                    errors.append(
+                    errors.append(ProfileIssue(
+                        'missing_attestation',
                         f"Operation '{op_id}': Critical manufacturing operations must have attestation (ISO-9001)"
-                    )
+                    ))
                 else:
                     mode = attestation.get('mode')
                     if mode not in self.REQUIRED_ATTESTATION_MODES:
-                        errors.append(
+                        errors.append(ProfileIssue(
+                            'attestation_mode_not_allowed',
                             f"Operation '{op_id}': Manufacturing operations require 'signed' or 'verifiable' attestation, got '{mode}'"
-                        )
+                        ))
 
             # CNC operations should reference a post-processor
             if op_type == 'cnc_machining':
@@ -198,9 +218,10 @@ class CAMv1Validator(BaseProfileValidator):
 
             # Machines must have identity (DID or URI)
             if 'did' not in machine and 'uri' not in machine:
-                errors.append(
+                errors.append(ProfileIssue(
+                    'missing_identity',
                     f"Tool '{machine_id}': Machine tools must have 'did' or 'uri' for identification (ISO-9001)"
-                )
+                ))
 
             # Machines should have calibration metadata
             metadata = machine.get('metadata', {})
@@ -234,9 +255,10 @@ class CAMv1Validator(BaseProfileValidator):
             # CAD models should have hash for integrity (ISO-9001)
             if entity_type == 'CADModel':
                 if 'hash' not in entity:
-                    errors.append(
+                    errors.append(ProfileIssue(
+                        'missing_hash',
                         f"Entity '{entity_id}': CADModel entities must have 'hash' for version control (ISO-9001)"
-                    )
+                    ))
 
                 # Should have version information
                 if 'version' not in entity:
@@ -312,15 +334,17 @@ class CAMv1Validator(BaseProfileValidator):
             # Check for quality records
             if 'quality_records' in iso_meta:
                 if not isinstance(iso_meta['quality_records'], list):
-                    errors.append(
+                    errors.append(ProfileIssue(
+                        'invalid_metadata',
                         "metadata.iso_9001.quality_records must be an array"
-                    )
+                    ))
 
             # Check for nonconformance tracking
             if 'nonconformances' in iso_meta:
                 if not isinstance(iso_meta['nonconformances'], list):
-                    errors.append(
+                    errors.append(ProfileIssue(
+                        'invalid_metadata',
                         "metadata.iso_9001.nonconformances must be an array"
-                    )
+                    ))
 
         return errors
@@ -7,9 +7,25 @@ Manages discovery and execution of industry-specific profile validators.
 from typing import Dict, List, Optional, Type
 
 from .ai_basic_v1 import AIBasicV1Validator
-from .base import BaseProfileValidator, ProfileValidationResult
+from .base import BaseProfileValidator, ProfileIssue, ProfileValidationResult
 from .cam_v1 import CAMv1Validator
 
+# Built-in profile validators keyed by profile_id, resolved once at import.
+# Each registry copies this map so custom registrations stay per-instance.
+# Order matters: it is also the auto-detection precedence.
+_BUILTIN_VALIDATORS: Dict[str, Type[BaseProfileValidator]] = {
+    validator_class.profile_id: validator_class
+    for validator_class in (AIBasicV1Validator, CAMv1Validator)
+}
+
+# Operation type -> profile_id dispatch table for auto-detection, built from
+# the operation types each built-in profile defines required parameters for
+_PROFILE_BY_OP_TYPE: Dict[str, str] = {
+    op_type: profile_id
+    for profile_id, validator_class in _BUILTIN_VALIDATORS.items()
+    for op_type in getattr(validator_class, 'REQUIRED_PARAMS', {})
+}
+
 
 class ProfileRegistry:
     """
@@ -26,8 +42,7 @@ class ProfileRegistry:
 
     def _register_builtin_profiles(self):
         """Register built-in profile validators"""
-        self.register(AIBasicV1Validator)
-        self.register(CAMv1Validator)
+        self._validators.update(_BUILTIN_VALIDATORS)
 
     def register(self, validator_class: Type[BaseProfileValidator]):
         """
@@ -36,11 +51,8 @@ class ProfileRegistry:
         Args:
             validator_class: Profile validator class (subclass of BaseProfileValidator)
         """
-        # Create temporary instance to get profile_id
-        temp_instance = validator_class()
-        profile_id = temp_instance.profile_id
-
-        self._validators[profile_id] = validator_class
+        # profile_id is a class attribute, so no instance is needed to read it
+        self._validators[validator_class.profile_id] = validator_class
 
     def get_validator(self, profile_id: str) -> Optional[BaseProfileValidator]:
         """
@@ -100,7 +112,7 @@ class ProfileRegistry:
         if validator is None:
             return ProfileValidationResult(
                 is_valid=False,
-                errors=[f"Profile '{profile_id}' not found in registry"],
+                errors=[ProfileIssue('unknown_profile', f"Profile '{profile_id}' not found in registry")],
                 warnings=[],
                 profile_id=profile_id,
                 profile_version="unknown"
@@ -124,20 +136,14 @@ class ProfileRegistry:
         if 'profile' in metadata:
             return metadata['profile']
 
-        # Auto-detect based on operation types
+        # Auto-detect based on operation types (one dict lookup per operation)
         operations = data.get('operations', [])
-        op_types = {op.get('type') for op in operations}
+        matched = {_PROFILE_BY_OP_TYPE.get(op.get('type')) for op in operations}
 
-        # AI profile indicators
-        ai_ops = {'ai_inference', 'ai_retrieval', 'ai_moderation', 'ai_training'}
-        if op_types & ai_ops:
-            return 'gg-ai-basic-v1'
-
-        # Manufacturing profile indicators
-        cam_ops = {'cnc_machining', 'additive_manufacturing', 'tessellation',
-                  'slicing', 'post_processing', 'quality_inspection'}
-        if op_types & cam_ops:
-            return 'gg-cam-v1'
+        # AI operations take precedence over manufacturing ones in mixed workflows
+        for profile_id in _BUILTIN_VALIDATORS:
+            if profile_id in matched:
+                return profile_id
 
         # No profile detected
         return None
@@ -13,6 +13,7 @@ where verifiable audit trails and tamper-evident logging are critical.
 
 import base64
 import hashlib
+import sys
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin
@@ -26,6 +27,13 @@ MAX_LOG_ID_LENGTH = 256
 MAX_ENTRY_ID_LENGTH = 128
 MAX_PROOF_LENGTH = 1024 * 1024  # 1MB max proof size
 
+# RFC 6962 domain-separation prefixes for leaf and interior node hashes
+_LEAF_PREFIX = b'\x00'
+_NODE_PREFIX = b'\x01'
+# Bound once: these hashes are tiny, so per-call lookup overhead is a
+# noticeable share of each one
+_sha256 = hashlib.sha256
+
 
 class TransparencyLogError(Exception):
     """Base exception for transparency log errors"""
@@ -54,6 +62,11 @@ class TransparencyLogEntry:
     timestamp: Optional[int] = None
     root_hash: Optional[str] = None
 
+    def __post_init__(self):
+        # Entries from the same log share one log_id string
+        if isinstance(self.log_id, str):
+            self.log_id = sys.intern(self.log_id)
+
 
 class RFC6962Verifier:
     """
@@ -79,7 +92,7 @@ class RFC6962Verifier:
         Returns:
             32-byte SHA-256 hash
         """
-        return hashlib.sha256(b'\x00' + data).digest()
+        return _sha256(_LEAF_PREFIX + data).digest()
 
     @staticmethod
     def hash_children(left: bytes, right: bytes) -> bytes:
@@ -95,7 +108,7 @@ class RFC6962Verifier:
         Returns:
             32-byte SHA-256 hash
         """
-        return hashlib.sha256(b'\x01' + left + right).digest()
+        return _sha256(b''.join((_NODE_PREFIX, left, right))).digest()
 
     @staticmethod
     def verify_inclusion_proof(
@@ -124,7 +137,73 @@ class RFC6962Verifier:
             InvalidTreeError: If tree parameters are invalid
             InvalidProofError: If proof structure is invalid
         """
-        # Validate inputs
+        RFC6962Verifier._check_inclusion_params(
+            leaf_hash, tree_size, leaf_index, len(proof_nodes), root_hash
+        )
+
+        for i, node in enumerate(proof_nodes):
+            if len(node) != 32:
+                raise InvalidProofError(
+                    f"Invalid proof node {i} length: {len(node)}"
+                )
+
+        return RFC6962Verifier._verify_path(
+            leaf_hash, leaf_index, proof_nodes, root_hash
+        )
+
+    @staticmethod
+    def verify_inclusion_proof_packed(
+        leaf_hash: bytes,
+        tree_size: int,
+        leaf_index: int,
+        proof_blob: bytes,
+        root_hash: bytes
+    ) -> bool:
+        """
+        Verify an inclusion proof whose sibling hashes are packed in one buffer
+
+        Same check as verify_inclusion_proof, but the proof is the 32-byte
+        sibling hashes concatenated in path order, as transparency logs
+        serialize them. The blob is validated as a whole, so callers holding
+        a serialized proof skip the per-node length checks.
+
+        Args:
+            leaf_hash: Hash of the leaf to verify (32 bytes)
+            tree_size: Total number of leaves in the tree
+            leaf_index: Index of the leaf (0-based)
+            proof_blob: Concatenated sibling hashes, 32 bytes each
+            root_hash: Expected root hash (32 bytes)
+
+        Returns:
+            True if the proof is valid, False otherwise
+
+        Raises:
+            InvalidTreeError: If tree parameters are invalid
+            InvalidProofError: If proof structure is invalid
+        """
+        if len(proof_blob) % 32 != 0:
+            raise InvalidProofError(
+                f"Proof length not multiple of 32: {len(proof_blob)}"
+            )
+
+        RFC6962Verifier._check_inclusion_params(
+            leaf_hash, tree_size, leaf_index, len(proof_blob) // 32, root_hash
+        )
+
+        proof_nodes = [proof_blob[i:i + 32] for i in range(0, len(proof_blob), 32)]
+        return RFC6962Verifier._verify_path(
+            leaf_hash, leaf_index, proof_nodes, root_hash
+        )
+
+    @staticmethod
+    def _check_inclusion_params(
+        leaf_hash: bytes,
+        tree_size: int,
+        leaf_index: int,
+        node_count: int,
+        root_hash: bytes
+    ) -> None:
+        """Validate inclusion proof inputs, raising on the first problem"""
         if leaf_index < 0 or leaf_index >= tree_size:
             raise InvalidTreeError(
                 f"Leaf index {leaf_index} out of range for tree size {tree_size}"
@@ -135,9 +214,9 @@ class RFC6962Verifier:
                 f"Invalid tree size: {tree_size}"
             )
 
-        if len(proof_nodes) > MAX_PROOF_NODES:
+        if node_count > MAX_PROOF_NODES:
             raise InvalidProofError(
-                f"Proof too long: {len(proof_nodes)} nodes (max {MAX_PROOF_NODES})"
+                f"Proof too long: {node_count} nodes (max {MAX_PROOF_NODES})"
             )
 
         if len(leaf_hash) != 32:
@@ -146,26 +225,32 @@ class RFC6962Verifier:
         if len(root_hash) != 32:
             raise InvalidProofError(f"Invalid root hash length: {len(root_hash)}")
 
-        for i, node in enumerate(proof_nodes):
-            if len(node) != 32:
-                raise InvalidProofError(
-                    f"Invalid proof node {i} length: {len(node)}"
-                )
-
+    @staticmethod
+    def _verify_path(
+        leaf_hash: bytes,
+        leaf_index: int,
+        proof_nodes: List[bytes],
+        root_hash: bytes
+    ) -> bool:
+        """Climb from the leaf to the root over already validated proof nodes"""
         # RFC 6962 audit proof algorithm
         # Start with the leaf hash and work up to the root
         current_hash = leaf_hash
         current_index = leaf_index
+        # Performance: the climb inlines hash_children and binds b''.join
+        # locally; per-level interpreter overhead is otherwise comparable to
+        # the SHA-256 of the 65-byte node itself
+        join = b''.join
 
         for proof_node in proof_nodes:
-            if current_index % 2 == 0:
-                # Current node is left child
-                current_hash = RFC6962Verifier.hash_children(current_hash, proof_node)
-            else:
+            if current_index & 1:
                 # Current node is right child
-                current_hash = RFC6962Verifier.hash_children(proof_node, current_hash)
+                current_hash = _sha256(join((_NODE_PREFIX, proof_node, current_hash))).digest()
+            else:
+                # Current node is left child
+                current_hash = _sha256(join((_NODE_PREFIX, current_hash, proof_node))).digest()
 
-            current_index //= 2
+            current_index >>= 1
 
         # Verify the computed root matches the expected root
         return current_hash == root_hash
@@ -492,17 +577,13 @@ class TransparencyLogVerifier:
                 )
                 return errors
 
-            # Parse proof nodes (assuming each node is 32 bytes)
+            # Proof nodes are 32-byte hashes packed back to back
             if len(proof_bytes) % 32 != 0:
                 errors.append(
                     f"{context}: Proof length not multiple of 32: {len(proof_bytes)}"
                 )
                 return errors
 
-            proof_nodes = [
-                proof_bytes[i:i+32] for i in range(0, len(proof_bytes), 32)
-            ]
-
             # Get root hash if provided
             root_hash = entry.get('root_hash')
             if root_hash:
@@ -530,11 +611,11 @@ class TransparencyLogVerifier:
                 tree_size = entry['tree_size']
 
                 try:
-                    is_valid = RFC6962Verifier.verify_inclusion_proof(
+                    is_valid = RFC6962Verifier.verify_inclusion_proof_packed(
                         leaf_hash=leaf_hash,
                         tree_size=tree_size,
                         leaf_index=leaf_index,
-                        proof_nodes=proof_nodes,
+                        proof_blob=proof_bytes,
                         root_hash=root_hash
                     )
 
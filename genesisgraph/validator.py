@@ -10,7 +10,7 @@ import json
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -79,6 +79,26 @@ HASH_PATTERN = re.compile(r'^(sha256|sha512|blake3):[a-f0-9]+$')
 # Examples: ed25519:abc123..., ecdsa:def456..., rsa:789abc...
 SIGNATURE_PATTERN = re.compile(r'^(ed25519|ecdsa|rsa):.+$')
 
+# Performance: Parsed schemas shared across validator instances
+# ==============================================================
+# Parsing the bundled schema YAML takes tens of milliseconds, and compiling
+# it into a jsonschema validator takes several more. Both are cached here,
+# keyed by (absolute path, mtime), so only the first validator instance per
+# schema file pays for them. Each entry is [schema, compiled_validator].
+_SCHEMA_CACHE: Dict[Tuple[str, float], List[Any]] = {}
+
+# Performance: Canonical JSON encoder built once
+# ================================================
+# json.dumps() constructs a new JSONEncoder on every call whenever it is
+# given non-default options. The encoder keeps no state between encode()
+# calls, so one shared instance gives identical output without that setup.
+# Separators with no spaces, keys sorted alphabetically.
+_CANONICAL_JSON_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(',', ':'),
+    ensure_ascii=False
+)
+
 
 class GenesisGraphValidator:
     """
@@ -107,6 +127,8 @@ class GenesisGraphValidator:
         """
         self.schema_path = schema_path
         self.schema = None
+        self._schema_validator = None
+        self._schema_cache_entry: Optional[List[Any]] = None
         self.verify_signatures = verify_signatures
         self.use_schema = use_schema
         self.verify_transparency = verify_transparency
@@ -170,11 +192,44 @@ class GenesisGraphValidator:
     def _load_schema(self, schema_path: str):
         """Load JSON Schema from file"""
         try:
-            with open(schema_path) as f:
-                self.schema = yaml.safe_load(f)
+            cache_key = (os.path.abspath(schema_path), os.path.getmtime(schema_path))
+            entry = _SCHEMA_CACHE.get(cache_key)
+            if entry is None:
+                with open(schema_path) as f:
+                    entry = [yaml.safe_load(f), None]
+                _SCHEMA_CACHE[cache_key] = entry
         except Exception as e:
             raise SchemaError(f"Failed to load schema: {e}") from e
 
+        self.schema = entry[0]
+        self._schema_cache_entry = entry
+
+    def _get_schema_validator(self) -> Any:
+        """
+        Return a jsonschema validator bound to the current schema
+
+        The schema is checked and the validator class resolved only once;
+        subsequent validate() calls reuse the compiled validator instead of
+        paying for jsonschema.validate()'s per-call setup. Schemas loaded from
+        a file share one compiled validator across instances. Rebuilt if
+        self.schema is replaced.
+
+        Raises:
+            jsonschema.SchemaError: If the schema itself is invalid
+        """
+        if self._schema_validator is None or self._schema_validator.schema is not self.schema:
+            entry = self._schema_cache_entry
+            shared = entry is not None and entry[0] is self.schema
+            if shared and entry[1] is not None:
+                self._schema_validator = entry[1]
+            else:
+                validator_class = jsonschema.validators.validator_for(self.schema)
+                validator_class.check_schema(self.schema)
+                self._schema_validator = validator_class(self.schema)
+                if shared:
+                    entry[1] = self._schema_validator
+        return self._schema_validator
+
     def validate_file(self, file_path: str) -> "ValidationResult":
         """
         Validate a GenesisGraph file
@@ -227,11 +282,17 @@ class GenesisGraphValidator:
             elif not SEMVER_PATTERN.match(spec_version):
                 warnings.append(f"spec_version '{spec_version}' does not follow semver format")
 
+        # Security: Documents over the entity/operation limits are rejected
+        # without the whole-document passes (schema, profile) below, which
+        # would otherwise still walk every item the limits exist to refuse
+        over_limits = False
+
         # 3. Validate entities
         entities = data.get('entities', [])
         if not isinstance(entities, list):
             errors.append("entities must be a list")
         else:
+            over_limits = len(entities) > MAX_ENTITIES
             entity_errors = self._validate_entities(entities, file_path)
             errors.extend(entity_errors)
 
@@ -240,6 +301,7 @@ class GenesisGraphValidator:
         if not isinstance(operations, list):
             errors.append("operations must be a list")
         else:
+            over_limits = over_limits or len(operations) > MAX_OPERATIONS
             op_errors = self._validate_operations(operations)
             errors.extend(op_errors)
 
@@ -251,12 +313,16 @@ class GenesisGraphValidator:
             tool_errors = self._validate_tools(tools)
             errors.extend(tool_errors)
 
+        if over_limits:
+            return ValidationResult(False, errors, warnings, data)
+
         # 6. JSON Schema validation (if available)
         if JSONSCHEMA_AVAILABLE and self.schema:
             try:
-                jsonschema.validate(instance=data, schema=self.schema)
-            except jsonschema.ValidationError as e:
-                errors.append(f"Schema validation failed: {e.message}")
+                schema_validator = self._get_schema_validator()
+                error = jsonschema.exceptions.best_match(schema_validator.iter_errors(data))
+                if error is not None:
+                    errors.append(f"Schema validation failed: {error.message}")
             except jsonschema.SchemaError as e:
                 warnings.append(f"Schema itself is invalid: {e.message}")
         elif not JSONSCHEMA_AVAILABLE:
@@ -835,7 +901,8 @@ class GenesisGraphValidator:
 
         return errors
 
-    def _canonical_json(self, data: Any) -> str:
+    @staticmethod
+    def _canonical_json(data: Any) -> str:
         """
         Compute canonical JSON representation for signing
 
@@ -857,13 +924,7 @@ class GenesisGraphValidator:
             >>> validator._canonical_json({"z": 1, "a": 2})
             '{"a":2,"z":1}'
         """
-        # Use separators with no spaces, sort keys alphabetically
-        return json.dumps(
-            data,
-            sort_keys=True,
-            separators=(',', ':'),
-            ensure_ascii=False
-        )
+        return _CANONICAL_JSON_ENCODER.encode(data)
 
     def _is_valid_hash(self, hash_str: str) -> bool:
         """Check if hash string is valid format"""
@@ -975,6 +1036,8 @@ class GenesisGraphValidator:
 class ValidationResult:
     """Result of validation"""
 
+    __slots__ = ('is_valid', 'errors', 'warnings', 'data')
+
     def __init__(
         self,
         is_valid: bool,
@@ -5,21 +5,36 @@ This module provides common fixtures and helper functions to reduce code
 duplication across test files.
 """
 
+import functools
 import json
 import os
 import tempfile
-from unittest.mock import Mock
+from collections import namedtuple
+from types import SimpleNamespace
 
 import pytest
 import yaml
 
 
 # Helper functions
+_BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+# Every two-digit base58 string, indexed by value (0..58**2-1)
+_BASE58_PAIRS = [hi + lo for hi in _BASE58_ALPHABET for lo in _BASE58_ALPHABET]
+_BASE58_PAIR_RADIX = 58 ** 2
+# 58**10 still fits a machine word, so each big-integer divmod yields ten digits
+_BASE58_CHUNK_RADIX = 58 ** 10
+
+
+@functools.lru_cache(maxsize=128)
 def _base58_encode_impl(data):
     """
     Base58 encode binary data.
 
     Used for encoding public keys in DID documents and other test scenarios.
+    Peels ten digits per big-integer divmod and emits them two at a time
+    from a lookup table, instead of one bignum divmod and one string
+    prepend per digit. Results are memoized, since tests keep re-encoding
+    the same few keys.
 
     Args:
         data: bytes to encode
@@ -27,29 +42,23 @@ def _base58_encode_impl(data):
     Returns:
         Base58-encoded string
     """
-    ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
     num = int.from_bytes(data, 'big')
 
-    # Handle zero case
-    if num == 0:
-        return '1' * len(data)
-
-    result = ''
-    while num > 0:
-        num, remainder = divmod(num, 58)
-        result = ALPHABET[remainder] + result
-
-    # Add leading '1's for leading zero bytes
-    for byte in data:
-        if byte == 0:
-            result = '1' + result
-        else:
-            break
+    pieces = []
+    while num:
+        num, chunk = divmod(num, _BASE58_CHUNK_RADIX)
+        for _ in range(5):
+            chunk, pair = divmod(chunk, _BASE58_PAIR_RADIX)
+            pieces.append(_BASE58_PAIRS[pair])
 
-    return result
+    # Chunks are zero-padded to ten digits; drop the padding, then add one
+    # '1' per leading zero byte
+    encoded = ''.join(reversed(pieces)).lstrip('1')
+    leading_zeros = len(data) - len(data.lstrip(b'\x00'))
+    return '1' * leading_zeros + encoded
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def base58_encode():
     """
     Fixture that provides the base58_encode function.
@@ -59,14 +68,40 @@ def base58_encode():
     return _base58_encode_impl
 
 
+FourLeafTree = namedtuple('FourLeafTree', ['leaf_hashes', 'level1', 'root'])
+
+
+@pytest.fixture(scope="session")
+def four_leaf_tree():
+    """
+    Balanced 4-leaf RFC 6962 Merkle tree, built once per session.
+
+    Returns a FourLeafTree of (leaf_hashes, level1, root), where level1 holds
+    the two interior nodes above the leaf pairs. Hashes are immutable bytes,
+    so sharing the tree across tests is safe.
+    """
+    from genesisgraph.transparency_log import RFC6962Verifier
+
+    leaves = [b"leaf_0", b"leaf_1", b"leaf_2", b"leaf_3"]
+    leaf_hashes = [RFC6962Verifier.hash_leaf(leaf) for leaf in leaves]
+    level1 = [
+        RFC6962Verifier.hash_children(leaf_hashes[0], leaf_hashes[1]),
+        RFC6962Verifier.hash_children(leaf_hashes[2], leaf_hashes[3]),
+    ]
+    root = RFC6962Verifier.hash_children(level1[0], level1[1])
+    return FourLeafTree(leaf_hashes, level1, root)
+
+
 # Mock response factories
 @pytest.fixture
 def mock_http_response():
     """
     Factory fixture for creating mock HTTP responses.
 
-    Returns a function that creates Mock response objects with configurable
-    status code, content type, and JSON data.
+    Returns a function that creates lightweight response objects with
+    configurable status code, content type, and JSON data. They are plain
+    SimpleNamespace carriers rather than Mocks, since tests only read them;
+    patch requests.get itself when call assertions are needed.
 
     Usage:
         def test_example(mock_http_response):
@@ -83,7 +118,7 @@ def mock_http_response():
         content=None
     ):
         """
-        Create a mock HTTP response.
+        Create a fake HTTP response.
 
         Args:
             status_code: HTTP status code (default: 200)
@@ -92,27 +127,36 @@ def mock_http_response():
             content: Raw bytes content (overrides json_data if provided)
 
         Returns:
-            Mock response object
+            Response-like object with status_code, headers, content,
+            json() and raise_for_status()
         """
-        mock_response = Mock()
-        mock_response.status_code = status_code
-        mock_response.headers = {'Content-Type': content_type}
-
         if content is not None:
-            mock_response.content = content
+            payload = {}
             if content_type.startswith('application/json'):
                 try:
-                    mock_response.json.return_value = json.loads(content.decode())
+                    payload = json.loads(content.decode())
                 except (json.JSONDecodeError, UnicodeDecodeError):
-                    mock_response.json.return_value = {}
+                    pass
         elif json_data is not None:
-            mock_response.json.return_value = json_data
-            mock_response.content = json.dumps(json_data).encode()
+            payload = json_data
+            content = json.dumps(json_data).encode()
         else:
-            mock_response.content = b''
-            mock_response.json.return_value = {}
-
-        return mock_response
+            payload = {}
+            content = b''
+
+        def raise_for_status():
+            if status_code >= 400:
+                # requests is an optional dependency; only needed on this path
+                import requests
+                raise requests.HTTPError(f"{status_code} Error")
+
+        return SimpleNamespace(
+            status_code=status_code,
+            headers={'Content-Type': content_type},
+            content=content,
+            json=lambda: payload,
+            raise_for_status=raise_for_status,
+        )
 
     return _create_response
 
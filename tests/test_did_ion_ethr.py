@@ -22,29 +22,11 @@ from genesisgraph.errors import ValidationError
 class TestDIDIonIntegration:
     """Integration tests for did:ion resolution"""
 
-    def test_resolve_did_ion_with_base58_key(self):
+    def test_resolve_did_ion_with_base58_key(self, base58_encode):
         """Test successful did:ion resolution with publicKeyBase58"""
         # Ed25519 public key (32 bytes)
         test_public_key = b'\x12\x34\x56\x78' * 8  # 32 bytes
 
-        # Base58 encode the key
-        def base58_encode(data):
-            ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-            num = int.from_bytes(data, 'big')
-            if num == 0:
-                return '1' * len(data)
-            result = ''
-            while num > 0:
-                num, remainder = divmod(num, 58)
-                result = ALPHABET[remainder] + result
-            # Add leading '1's for leading zero bytes
-            for byte in data:
-                if byte == 0:
-                    result = '1' + result
-                else:
-                    break
-            return result
-
         key_base58 = base58_encode(test_public_key)
 
         # Mock DID document (ION format)
@@ -159,20 +141,11 @@ class TestDIDIonIntegration:
             with pytest.raises(ValidationError, match="Invalid JSON in did:ion document"):
                 resolver.resolve_to_public_key(did)
 
-    def test_resolve_did_ion_rate_limiting(self):
+    def test_resolve_did_ion_rate_limiting(self, base58_encode):
         """Test rate limiting for did:ion resolution"""
         did = "did:ion:EiDahaOGH-liLLdDtTxEAdc8i-cfCz-WUcQdRJheMVNn3A"
         test_public_key = b'\x12\x34\x56\x78' * 8
 
-        def base58_encode(data):
-            ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-            num = int.from_bytes(data, 'big')
-            result = ''
-            while num > 0:
-                num, remainder = divmod(num, 58)
-                result = ALPHABET[remainder] + result
-            return result
-
         did_document = {
             "id": did,
             "verificationMethod": [{
@@ -206,28 +179,11 @@ class TestDIDIonIntegration:
 class TestDIDEthrIntegration:
     """Integration tests for did:ethr resolution"""
 
-    def test_resolve_did_ethr_with_base58_key(self):
+    def test_resolve_did_ethr_with_base58_key(self, base58_encode):
         """Test successful did:ethr resolution with publicKeyBase58"""
         # Ed25519 public key (32 bytes)
         test_public_key = b'\x98\x76\x54\x32' * 8  # 32 bytes
 
-        # Base58 encode the key
-        def base58_encode(data):
-            ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-            num = int.from_bytes(data, 'big')
-            if num == 0:
-                return '1' * len(data)
-            result = ''
-            while num > 0:
-                num, remainder = divmod(num, 58)
-                result = ALPHABET[remainder] + result
-            for byte in data:
-                if byte == 0:
-                    result = '1' + result
-                else:
-                    break
-            return result
-
         key_base58 = base58_encode(test_public_key)
 
         # Mock DID document (Ethereum format)
@@ -270,19 +226,10 @@ class TestDIDEthrIntegration:
             assert kwargs['verify'] is True
             assert kwargs['allow_redirects'] is False
 
-    def test_resolve_did_ethr_with_multibase_key(self):
+    def test_resolve_did_ethr_with_multibase_key(self, base58_encode):
         """Test did:ethr resolution with publicKeyMultibase"""
         test_public_key = b'\xaa\xbb\xcc\xdd' * 8  # 32 bytes
 
-        def base58_encode(data):
-            ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-            num = int.from_bytes(data, 'big')
-            result = ''
-            while num > 0:
-                num, remainder = divmod(num, 58)
-                result = ALPHABET[remainder] + result
-            return result
-
         key_multibase = 'z' + base58_encode(test_public_key)
 
         # did:ethr with chain ID
@@ -393,19 +340,10 @@ class TestDIDEthrIntegration:
             with pytest.raises(ValidationError, match="Could not find public key"):
                 resolver.resolve_to_public_key(did)
 
-    def test_resolve_did_ethr_with_specific_key_id(self):
+    def test_resolve_did_ethr_with_specific_key_id(self, base58_encode):
         """Test did:ethr resolution with specific key ID"""
         test_public_key = b'\xde\xad\xbe\xef' * 8  # 32 bytes
 
-        def base58_encode(data):
-            ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-            num = int.from_bytes(data, 'big')
-            result = ''
-            while num > 0:
-                num, remainder = divmod(num, 58)
-                result = ALPHABET[remainder] + result
-            return result
-
         did = "did:ethr:0xf3beac30c498d9e26865f34fcaa57dbb935b0d74"
         did_document = {
             "id": did,
@@ -439,19 +377,10 @@ class TestDIDEthrIntegration:
 
             assert public_key == test_public_key
 
-    def test_resolve_did_ethr_custom_resolver(self):
+    def test_resolve_did_ethr_custom_resolver(self, base58_encode):
         """Test did:ethr with custom resolver endpoint"""
         test_public_key = b'\xca\xfe\xba\xbe' * 8  # 32 bytes
 
-        def base58_encode(data):
-            ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-            num = int.from_bytes(data, 'big')
-            result = ''
-            while num > 0:
-                num, remainder = divmod(num, 58)
-                result = ALPHABET[remainder] + result
-            return result
-
         did = "did:ethr:0xf3beac30c498d9e26865f34fcaa57dbb935b0d74"
         did_document = {
             "id": did,
@@ -486,20 +415,11 @@ class TestDIDEthrIntegration:
 class TestDIDCaching:
     """Test caching behavior for did:ion and did:ethr"""
 
-    def test_did_ion_caching(self):
+    def test_did_ion_caching(self, base58_encode):
         """Test that did:ion results are cached"""
         did = "did:ion:EiDahaOGH-liLLdDtTxEAdc8i-cfCz-WUcQdRJheMVNn3A"
         test_public_key = b'\x12\x34\x56\x78' * 8
 
-        def base58_encode(data):
-            ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-            num = int.from_bytes(data, 'big')
-            result = ''
-            while num > 0:
-                num, remainder = divmod(num, 58)
-                result = ALPHABET[remainder] + result
-            return result
-
         did_document = {
             "id": did,
             "verificationMethod": [{
@@ -530,20 +450,11 @@ class TestDIDCaching:
             assert public_key2 == test_public_key
             assert mock_get.call_count == 1  # No additional calls
 
-    def test_did_ethr_caching(self):
+    def test_did_ethr_caching(self, base58_encode):
         """Test that did:ethr results are cached"""
         did = "did:ethr:0xf3beac30c498d9e26865f34fcaa57dbb935b0d74"
         test_public_key = b'\x98\x76\x54\x32' * 8
 
-        def base58_encode(data):
-            ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-            num = int.from_bytes(data, 'big')
-            result = ''
-            while num > 0:
-                num, remainder = divmod(num, 58)
-                result = ALPHABET[remainder] + result
-            return result
-
         did_document = {
             "id": did,
             "verificationMethod": [{
@@ -8,6 +8,8 @@ Tests cover:
 - Integration with SD-JWT
 """
 
+import json
+
 import pytest
 
 # Test if credentials module is available
@@ -15,6 +17,7 @@ try:
     from genesisgraph.credentials.predicates import (
         PredicateProof,
         PredicateType,
+        _canonical_value,
         batch_create_predicates,
         combine_with_sd_jwt,
         create_predicate,
@@ -293,6 +296,18 @@ class TestBatchPredicates:
         assert temp_proof.disclosed_value == 0.25  # Disclosed
         assert prompt_proof.disclosed_value is None  # Not disclosed
 
+    def test_batch_create_uses_distinct_salts(self):
+        """Test batch-drawn salts are unique and each commitment verifies"""
+        claims = {f"claim_{i}": i for i in range(8)}
+        predicates = {name: {"type": "gte", "threshold": 0} for name in claims}
+
+        proofs = batch_create_predicates(claims, predicates, disclose_values=list(claims))
+
+        salts = [proof.salt for proof in proofs]
+        assert len(set(salts)) == len(salts)
+        assert all(len(salt) == 32 for salt in salts)
+        assert all(verify_predicate(proof)["valid"] for proof in proofs)
+
 
 class TestSDJWTPredicateCombination:
     """Test combining predicates with SD-JWT"""
@@ -392,6 +407,14 @@ class TestPredicateSerialization:
         assert restored.threshold == original.threshold
         assert restored.satisfied == original.satisfied
 
+    @pytest.mark.parametrize(
+        "value",
+        [0, 3500, -7, 0.25, 1e-7, 1e22, True, None, "0.25", float("inf"), [1, 2.5], {"b": 1, "a": 2}],
+    )
+    def test_canonical_value_matches_json(self, value):
+        """Test the numeric fast path keeps commitments byte-identical to json.dumps"""
+        assert _canonical_value(value) == json.dumps(value, sort_keys=True)
+
 
 class TestPredicateUseCases:
     """Real-world use case tests"""
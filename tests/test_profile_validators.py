@@ -2,8 +2,10 @@
 Tests for industry-specific profile validators
 """
 
+import pickle
+
 from genesisgraph.compliance import FDA21CFR11Validator, ISO9001Validator
-from genesisgraph.profiles import ProfileRegistry
+from genesisgraph.profiles import ProfileIssue, ProfileRegistry
 from genesisgraph.profiles.ai_basic_v1 import AIBasicV1Validator
 from genesisgraph.profiles.cam_v1 import CAMv1Validator
 
@@ -93,6 +95,7 @@ class TestAIBasicV1Validator:
         result = validator.validate_profile(data)
         assert not result.is_valid
         assert len(result.errors) >= 4  # Missing 4+ parameters
+        assert result.has_error('missing_parameter')
 
     def test_invalid_temperature_range(self):
         """Test validation fails for temperature outside valid range"""
@@ -122,6 +125,7 @@ class TestAIBasicV1Validator:
         result = validator.validate_profile(data)
         assert not result.is_valid
         assert any('temperature' in error for error in result.errors)
+        assert result.has_error('parameter_out_of_range')
 
     def test_dataset_without_hash(self):
         """Test warning for dataset without hash"""
@@ -145,6 +149,7 @@ class TestAIBasicV1Validator:
         result = validator.validate_profile(data)
         assert not result.is_valid
         assert any('hash' in error.lower() for error in result.errors)
+        assert result.has_error('missing_hash')
 
     def test_redacted_parameters_skip_validation(self):
         """Test that redacted parameters skip validation"""
@@ -171,6 +176,87 @@ class TestAIBasicV1Validator:
         assert result.is_valid
         assert len(result.errors) == 0
 
+    def test_human_review_downstream_suppresses_warning(self):
+        """Test a human review operation suppresses the human review warning"""
+        validator = AIBasicV1Validator()
+        params = {
+            'temperature': 0.2,
+            'top_p': 0.9,
+            'prompt_length_chars': 10,
+            'model_name': 'm',
+            'model_version': '1'
+        }
+
+        data = {
+            'operations': [
+                {'id': 'inf1', 'type': 'ai_inference', 'inputs': [], 'outputs': ['draft'],
+                 'parameters': params, 'attestation': {'mode': 'signed'}},
+                {'id': 'review1', 'type': 'human_review', 'inputs': ['draft'], 'outputs': []}
+            ]
+        }
+        result = validator.validate_profile(data)
+        assert not any('human review' in warning for warning in result.warnings)
+
+        data['operations'].pop()
+        result = validator.validate_profile(data)
+        assert any('human review' in warning for warning in result.warnings)
+
+    def test_human_review_warning_ignores_review_inputs(self):
+        """Test the warning depends only on whether a human_review operation exists"""
+        validator = AIBasicV1Validator()
+        params = {
+            'temperature': 0.2,
+            'top_p': 0.9,
+            'prompt_length_chars': 10,
+            'model_name': 'm',
+            'model_version': '1'
+        }
+
+        # The review consumes an unrelated entity, referenced as a dict
+        data = {
+            'operations': [
+                {'id': 'inf1', 'type': 'ai_inference', 'inputs': [], 'outputs': ['draft'],
+                 'parameters': params, 'attestation': {'mode': 'signed'}},
+                {'id': 'review1', 'type': 'human_review',
+                 'inputs': [{'entity_id': 'other'}], 'outputs': []}
+            ]
+        }
+        result = validator.validate_profile(data)
+        assert not any('human review' in warning for warning in result.warnings)
+
+    def test_subclass_required_params_override(self):
+        """Test subclasses overriding REQUIRED_PARAMS get their own required sets"""
+        class StrictAIValidator(AIBasicV1Validator):
+            REQUIRED_PARAMS = {'ai_inference': ['temperature', 'seed']}
+
+        data = {
+            'operations': [
+                {'id': 'inf1', 'type': 'ai_inference', 'inputs': [], 'outputs': [],
+                 'parameters': {'temperature': 0.1}}
+            ]
+        }
+
+        result = StrictAIValidator().validate_profile(data)
+        assert any("'seed'" in error for error in result.errors)
+        assert AIBasicV1Validator._REQUIRED_PARAM_SETS['ai_inference'] != frozenset(['temperature', 'seed'])
+
+    def test_profile_issue_behaves_like_message(self):
+        """Test coded errors remain plain strings for existing consumers"""
+        issue = ProfileIssue('missing_hash', "Entity 'd1': Dataset entities must have 'hash'")
+
+        assert issue == "Entity 'd1': Dataset entities must have 'hash'"
+        assert 'hash' in issue.lower()
+        assert pickle.loads(pickle.dumps(issue)).code == 'missing_hash'
+
+    def test_has_error_sees_errors_added_later(self):
+        """Test has_error reflects errors appended after the result is built"""
+        result = AIBasicV1Validator().validate_profile({'operations': []})
+        assert not result.has_error('missing_hash')
+
+        result.errors.append(ProfileIssue('missing_hash', "Entity 'd1': missing 'hash'"))
+        assert result.has_error('missing_hash')
+        assert result.error_codes == frozenset(['missing_hash'])
+
 
 class TestCAMv1Validator:
     """Tests for Computer-Aided Manufacturing v1 profile validator"""
@@ -275,6 +361,7 @@ class TestCAMv1Validator:
         result = validator.validate_profile(data)
         assert not result.is_valid
         assert len(result.errors) >= 4
+        assert result.has_error('missing_parameter')
 
     def test_negative_tolerance(self):
         """Test validation fails for negative tolerance"""
@@ -304,6 +391,7 @@ class TestCAMv1Validator:
         result = validator.validate_profile(data)
         assert not result.is_valid
         assert any('tolerance' in error.lower() for error in result.errors)
+        assert result.has_error('parameter_out_of_range')
 
     def test_cad_model_without_hash(self):
         """Test error for CAD model without hash (ISO-9001 requirement)"""
@@ -328,6 +416,7 @@ class TestCAMv1Validator:
         assert not result.is_valid
         assert any('hash' in error.lower() and 'iso-9001' in error.lower()
                   for error in result.errors)
+        assert result.has_error('missing_hash')
 
     def test_critical_operation_without_attestation(self):
         """Test error for critical manufacturing operation without attestation"""
@@ -358,6 +447,38 @@ class TestCAMv1Validator:
         result = validator.validate_profile(data)
         assert not result.is_valid
         assert any('attestation' in error.lower() for error in result.errors)
+        assert result.has_error('missing_attestation')
+
+    def test_fail_fast_stops_after_first_failing_stage(self):
+        """Test fail_fast returns only the first failing stage's errors"""
+        data = {
+            'entities': [
+                {'id': 'cad1', 'type': 'CADModel', 'version': '1.0', 'file': 'part.step'}
+            ],
+            'operations': [
+                {'id': 'cnc1', 'type': 'cnc_machining', 'inputs': ['cad1'], 'outputs': [],
+                 'parameters': {'_redacted': True}}
+            ]
+        }
+
+        full = CAMv1Validator().validate_profile(data)
+        fast = CAMv1Validator().validate_profile(data, fail_fast=True)
+
+        assert full.has_error('missing_hash') and full.has_error('missing_attestation')
+        assert not fast.is_valid
+        assert fast.has_error('missing_hash')
+        assert not fast.has_error('missing_attestation')
+
+    def test_validate_profiles_batch(self):
+        """Test batch validation returns independent results in input order"""
+        valid = {'entities': [{'id': 'cad1', 'type': 'CADModel', 'hash': 'sha256:abc'}]}
+        invalid = {'entities': [{'id': 'cad2', 'type': 'CADModel'}]}
+
+        results = CAMv1Validator().validate_profiles([invalid, valid, invalid])
+
+        assert [r.is_valid for r in results] == [False, True, False]
+        assert results[0].errors is not results[2].errors
+        assert results[1].errors == []
 
 
 class TestProfileRegistry:
@@ -379,6 +500,17 @@ class TestProfileRegistry:
         assert validator is not None
         assert isinstance(validator, AIBasicV1Validator)
 
+    def test_custom_registration_is_per_registry(self):
+        """Test custom profiles registered on one registry don't leak into others"""
+        class CustomValidator(CAMv1Validator):
+            profile_id = "gg-custom-v1"
+
+        registry = ProfileRegistry()
+        registry.register(CustomValidator)
+
+        assert 'gg-custom-v1' in registry.list_profiles()
+        assert 'gg-custom-v1' not in ProfileRegistry().list_profiles()
+
     def test_auto_detect_ai_profile(self):
         """Test auto-detection of AI profile"""
         registry = ProfileRegistry()
@@ -411,6 +543,20 @@ class TestProfileRegistry:
         profile_id = registry._detect_profile(data)
         assert profile_id == 'gg-cam-v1'
 
+    def test_auto_detect_mixed_workflow_prefers_ai_profile(self):
+        """Test AI operations win detection regardless of operation order"""
+        registry = ProfileRegistry()
+
+        data = {
+            'operations': [
+                {'id': 'op1', 'type': 'cnc_machining', 'inputs': [], 'outputs': []},
+                {'id': 'op2', 'type': 'ai_training', 'inputs': [], 'outputs': []}
+            ]
+        }
+
+        assert registry._detect_profile(data) == 'gg-ai-basic-v1'
+        assert registry._detect_profile({'operations': [{'type': 'transform'}]}) is None
+
     def test_explicit_profile_in_metadata(self):
         """Test explicit profile declaration in metadata"""
         registry = ProfileRegistry()
@@ -562,6 +708,23 @@ class TestFDA21CFR11Validator:
         assert not result['is_valid']
         assert any('11.10(c)' in error for error in result['errors'])
 
+    def test_weak_hash_algorithm_warning(self):
+        """Test md5/sha1 hashes are flagged while SHA-256 is accepted"""
+        validator = FDA21CFR11Validator()
+
+        data = {
+            'entities': [
+                {'id': 'weak1', 'type': 'Dataset', 'hash': 'md5:abc'},
+                {'id': 'weak2', 'type': 'Dataset', 'hash': 'sha1:abc'},
+                {'id': 'strong', 'type': 'Dataset', 'hash': 'sha256:abc'}
+            ]
+        }
+
+        result = validator.validate(data)
+        weak = [w for w in result['warnings'] if 'weak hash algorithm' in w]
+        assert len(weak) == 2
+        assert not any("'strong'" in w for w in weak)
+
     def test_missing_attestation_timestamp(self):
         """Test failure when attestation lacks timestamp"""
         validator = FDA21CFR11Validator()
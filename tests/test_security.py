@@ -9,12 +9,17 @@ Tests security vulnerabilities and mitigations including:
 """
 
 import os
-import tempfile
+import re
 from unittest.mock import patch
 
 import pytest
 
-from genesisgraph.did_resolver import DIDResolver
+from genesisgraph.did_resolver import (
+    MAX_BASE58_LENGTH,
+    MAX_DID_LENGTH,
+    MAX_RESPONSE_SIZE,
+    DIDResolver,
+)
 from genesisgraph.errors import ValidationError
 from genesisgraph.validator import (
     MAX_ENTITIES,
@@ -23,213 +28,200 @@ from genesisgraph.validator import (
     GenesisGraphValidator,
 )
 
-
-class TestPathTraversalProtection:
-    """Test path traversal attack prevention"""
-
-    def test_parent_directory_reference_blocked(self):
-        """Test that ../ references are blocked"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a valid document file
-            doc_path = os.path.join(tmpdir, 'test.gg.yaml')
-            with open(doc_path, 'w') as f:
-                f.write('')
-
-            # Try to access parent directory
-            data = {
-                'spec_version': '0.1.0',
-                'entities': [
-                    {
-                        'id': 'malicious',
-                        'type': 'File',
-                        'version': '1',
-                        'file': '../../../etc/passwd',
-                        'hash': 'sha256:' + '0' * 64
-                    }
-                ],
-                'operations': [],
-                'tools': []
+# Over-limit inputs, allocated once per session rather than once per test run
+_OVERSIZE_PAYLOAD = b'x' * (MAX_RESPONSE_SIZE + 1)
+_LONG_ID = 'x' * (MAX_ID_LENGTH + 1)
+_LONG_DID = 'did:key:' + 'z' * (MAX_DID_LENGTH + 1)
+_LONG_B58 = '1' * (MAX_BASE58_LENGTH + 1)
+
+# Error-message patterns shared by the pytest.raises(match=...) checks
+_BLOCKED_HOST_RE = re.compile(r'blocked host', re.I)
+_RATE_LIMIT_RE = re.compile(r'rate limit', re.I)
+_TOO_LONG_RE = re.compile(r'too long', re.I)
+_CONTENT_TYPE_RE = re.compile(r'content type', re.I)
+_TOO_LARGE_RE = re.compile(r'too large', re.I)
+
+_ZERO_HASH = 'sha256:' + '0' * 64
+
+
+def _file_document(path, entity_id='malicious'):
+    """Document with a single File entity referencing path (hash is a placeholder)"""
+    return {
+        'spec_version': '0.1.0',
+        'entities': [
+            {
+                'id': entity_id,
+                'type': 'File',
+                'version': '1',
+                'file': path,
+                'hash': _ZERO_HASH
             }
+        ],
+        'operations': [],
+        'tools': []
+    }
 
-            validator = GenesisGraphValidator()
-            result = validator.validate(data, file_path=doc_path)
 
-            assert not result.is_valid
-            assert any('parent directory' in err.lower() for err in result.errors)
+def _err_contains(result, *needles):
+    """True if any needle appears in the result's errors (case-insensitive)"""
+    blob = '\n'.join(result.errors).lower()
+    return any(needle in blob for needle in needles)
 
-    def test_absolute_path_blocked(self):
-        """Test that absolute paths are blocked"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            doc_path = os.path.join(tmpdir, 'test.gg.yaml')
-            with open(doc_path, 'w') as f:
-                f.write('')
-
-            # Try to use absolute path
-            data = {
-                'spec_version': '0.1.0',
-                'entities': [
-                    {
-                        'id': 'malicious',
-                        'type': 'File',
-                        'version': '1',
-                        'file': '/etc/passwd',
-                        'hash': 'sha256:' + '0' * 64
-                    }
-                ],
-                'operations': [],
-                'tools': []
-            }
 
-            validator = GenesisGraphValidator()
-            result = validator.validate(data, file_path=doc_path)
+@pytest.fixture(scope="module")
+def validator():
+    """Validator shared across the module (validate() keeps no per-call state)"""
+    return GenesisGraphValidator()
 
-            assert not result.is_valid
-            assert any('absolute path' in err.lower() for err in result.errors)
 
-    def test_path_traversal_with_normalized_path(self):
-        """Test path traversal using various encoding"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            doc_path = os.path.join(tmpdir, 'test.gg.yaml')
-            with open(doc_path, 'w') as f:
-                f.write('')
-
-            # Try various path traversal techniques
-            malicious_paths = [
-                '../../etc/passwd',
-                './../../../etc/passwd',
-                'subdir/../../etc/passwd',
-                './../../etc/passwd',
-            ]
-
-            for malicious_path in malicious_paths:
-                data = {
-                    'spec_version': '0.1.0',
-                    'entities': [
-                        {
-                            'id': 'malicious',
-                            'type': 'File',
-                            'version': '1',
-                            'file': malicious_path,
-                            'hash': 'sha256:' + '0' * 64
-                        }
-                    ],
-                    'operations': [],
-                    'tools': []
-                }
+@pytest.fixture(scope="module")
+def doc_path(tmp_path_factory):
+    """Path of an empty GenesisGraph document that file references resolve against"""
+    path = tmp_path_factory.mktemp('gg') / 'test.gg.yaml'
+    path.write_text('')
+    return str(path)
 
-                validator = GenesisGraphValidator()
-                result = validator.validate(data, file_path=doc_path)
 
-                assert not result.is_valid, f"Path traversal not blocked: {malicious_path}"
-                assert any(
-                    'parent directory' in err.lower() or 'traversal' in err.lower()
-                    for err in result.errors
-                ), f"Wrong error for path: {malicious_path}"
+@pytest.fixture(scope="session")
+def too_many_entities_doc():
+    """Document one entity over MAX_ENTITIES, built once (validate() does not mutate it)"""
+    # The count limit is checked before any entity is inspected, so one
+    # shared entity dict is enough to exceed it
+    entity = {'id': 'entity', 'type': 'File', 'version': '1', 'uri': 'http://example.com/file'}
+    return {
+        'spec_version': '0.1.0',
+        'entities': [entity] * (MAX_ENTITIES + 1),
+        'operations': [],
+        'tools': []
+    }
 
-    def test_valid_relative_path_allowed(self):
-        """Test that valid relative paths are allowed"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            doc_path = os.path.join(tmpdir, 'test.gg.yaml')
-            test_file = os.path.join(tmpdir, 'data.txt')
-
-            with open(doc_path, 'w') as f:
-                f.write('')
-            with open(test_file, 'w') as f:
-                f.write('test data')
-
-            data = {
-                'spec_version': '0.1.0',
-                'entities': [
-                    {
-                        'id': 'safe',
-                        'type': 'File',
-                        'version': '1',
-                        'file': 'data.txt',
-                        'hash': 'sha256:' + '0' * 64  # Wrong hash, but path should be allowed
-                    }
-                ],
-                'operations': [],
-                'tools': []
-            }
-
-            validator = GenesisGraphValidator()
-            result = validator.validate(data, file_path=doc_path)
-
-            # Should fail on hash mismatch, not path traversal
-            if not result.is_valid:
-                assert not any(
-                    'traversal' in err.lower() or 'absolute path' in err.lower()
-                    for err in result.errors
-                )
 
+@pytest.fixture(scope="session")
+def too_many_operations_doc():
+    """Document one operation over MAX_OPERATIONS, built once"""
+    operation = {'id': 'op', 'type': 'Transform', 'inputs': [], 'outputs': []}
+    return {
+        'spec_version': '0.1.0',
+        'entities': [],
+        'operations': [operation] * (MAX_OPERATIONS + 1),
+        'tools': []
+    }
 
-class TestSSRFProtection:
-    """Test SSRF protection in DID resolver"""
-
-    def test_localhost_blocked(self):
-        """Test that localhost is blocked"""
-        resolver = DIDResolver()
 
-        with pytest.raises(ValidationError) as exc_info:
-            resolver.resolve_to_public_key('did:web:localhost:test')
+@pytest.fixture
+def resolver():
+    """Fresh DID resolver per test, since it holds cache and rate-limit state"""
+    return DIDResolver()
 
-        assert 'blocked host' in str(exc_info.value).lower()
 
-    def test_127_0_0_1_blocked(self):
-        """Test that 127.0.0.1 is blocked"""
-        resolver = DIDResolver()
+class TestPathTraversalProtection:
+    """Test path traversal attack prevention"""
 
-        with pytest.raises(ValidationError) as exc_info:
-            resolver.resolve_to_public_key('did:web:127.0.0.1:test')
+    def test_parent_directory_reference_blocked(self, validator, doc_path):
+        """Test that ../ references are blocked"""
+        # Try to access parent directory
+        data = _file_document('../../../etc/passwd')
 
-        assert 'blocked host' in str(exc_info.value).lower()
+        result = validator.validate(data, file_path=doc_path)
 
-    def test_aws_metadata_service_blocked(self):
-        """Test that AWS metadata service IP is blocked"""
-        resolver = DIDResolver()
+        assert not result.is_valid
+        assert _err_contains(result, 'parent directory')
 
-        with pytest.raises(ValidationError) as exc_info:
-            resolver.resolve_to_public_key('did:web:169.254.169.254:latest:meta-data')
+    def test_absolute_path_blocked(self, validator, doc_path):
+        """Test that absolute paths are blocked"""
+        # Try to use absolute path
+        data = _file_document('/etc/passwd')
 
-        assert 'blocked host' in str(exc_info.value).lower()
+        result = validator.validate(data, file_path=doc_path)
 
-    def test_private_network_10_blocked(self):
-        """Test that 10.0.0.0/8 network is blocked"""
-        resolver = DIDResolver()
+        assert not result.is_valid
+        assert _err_contains(result, 'absolute path')
+
+    @pytest.mark.parametrize('malicious_path', [
+        '../../etc/passwd',
+        './../../../etc/passwd',
+        'subdir/../../etc/passwd',
+        './../../etc/passwd',
+    ])
+    def test_path_traversal_with_normalized_path(self, validator, doc_path, malicious_path):
+        """Test path traversal using various encoding"""
+        data = _file_document(malicious_path)
 
-        with pytest.raises(ValidationError) as exc_info:
-            resolver.resolve_to_public_key('did:web:10.0.0.1:test')
+        result = validator.validate(data, file_path=doc_path)
 
-        assert 'blocked host' in str(exc_info.value).lower()
+        assert not result.is_valid, f"Path traversal not blocked: {malicious_path}"
+        assert _err_contains(result, 'parent directory', 'traversal'), (
+            f"Wrong error for path: {malicious_path}"
+        )
 
-    def test_private_network_192_168_blocked(self):
-        """Test that 192.168.0.0/16 network is blocked"""
-        resolver = DIDResolver()
+    def test_valid_relative_path_allowed(self, validator, doc_path):
+        """Test that valid relative paths are allowed"""
+        test_file = os.path.join(os.path.dirname(doc_path), 'data.txt')
+        with open(test_file, 'w') as f:
+            f.write('test data')
 
-        with pytest.raises(ValidationError) as exc_info:
-            resolver.resolve_to_public_key('did:web:192.168.1.1:test')
+        # Wrong hash, but path should be allowed
+        data = _file_document('data.txt', entity_id='safe')
 
-        assert 'blocked host' in str(exc_info.value).lower()
+        result = validator.validate(data, file_path=doc_path)
 
-    def test_private_network_172_16_blocked(self):
-        """Test that 172.16.0.0/12 network is blocked"""
-        resolver = DIDResolver()
+        # Should fail on hash mismatch, not path traversal
+        if not result.is_valid:
+            assert not _err_contains(result, 'traversal', 'absolute path')
 
-        with pytest.raises(ValidationError) as exc_info:
-            resolver.resolve_to_public_key('did:web:172.16.0.1:test')
 
-        assert 'blocked host' in str(exc_info.value).lower()
+class TestSSRFProtection:
+    """Test SSRF protection in DID resolver"""
 
-    def test_ipv6_localhost_blocked(self):
+    @pytest.mark.parametrize("did", [
+        'did:web:localhost:test',
+        'did:web:127.0.0.1:test',
+        'did:web:169.254.169.254:latest:meta-data',  # AWS metadata service
+        'did:web:10.0.0.1:test',
+        'did:web:192.168.1.1:test',
+        'did:web:172.16.0.1:test',
+        # Alternate spellings the system resolver maps onto blocked addresses
+        'did:web:LOCALHOST:test',
+        'did:web:localhost.:test',
+        'did:web:0x7f000001:test',
+        'did:web:2130706433:test',
+        'did:web:0177.0.0.1:test',
+        'did:web:127.1:test',
+        'did:web:0000.0000.0000.0000:test',
+        'did:web:0.0.0.0:test',
+    ])
+    def test_blocked_hosts(self, resolver, did):
+        """Test that internal hosts are blocked, however they are spelled"""
+        with pytest.raises(ValidationError, match=_BLOCKED_HOST_RE):
+            resolver.resolve_to_public_key(did)
+
+    def test_ipv6_localhost_blocked(self, resolver):
         """Test that IPv6 localhost is blocked"""
         # Note: did:web doesn't have a standard way to represent IPv6 addresses
         # We test that the blocking logic works when called directly
-        resolver = DIDResolver()
 
         # Test the blocking function directly
         assert resolver._is_blocked_host('::1')
         assert resolver._is_blocked_host('::ffff:127.0.0.1')
 
+    @pytest.mark.parametrize("host,blocked", [
+        ('10.0.0.0', True),
+        ('10.255.255.255', True),
+        ('11.0.0.0', False),
+        ('172.15.255.255', False),
+        ('172.31.255.255', True),
+        ('172.32.0.0', False),
+        ('192.168.0.1', True),
+        ('8.8.8.8', False),
+        ('fe80::1', True),
+        ('::ffff:10.0.0.1', True),
+        ('::ffff:8.8.8.8', False),
+        ('2001:db8::1', False),
+    ])
+    def test_blocked_network_boundaries(self, resolver, host, blocked):
+        """Test range edges of the compiled blocked-network lookup"""
+        assert resolver._is_blocked_host(host) is blocked
+
 
 class TestRateLimiting:
     """Test rate limiting in DID resolver"""
@@ -251,94 +243,78 @@ class TestRateLimiting:
             except ValidationError:
                 pass  # We expect key extraction to fail, but not rate limiting
 
-        # Next request should be rate limited
-        with pytest.raises(ValidationError) as exc_info:
-            resolver.resolve_to_public_key('did:web:example.com:user6')
+        assert mock_get.call_count == 5
 
-        assert 'rate limit' in str(exc_info.value).lower()
+        # Next request should be rate limited before any HTTP call is made
+        with pytest.raises(ValidationError, match=_RATE_LIMIT_RE):
+            resolver.resolve_to_public_key('did:web:example.com:user6')
+        assert mock_get.call_count == 5
 
 
 class TestCacheTTL:
     """Test cache TTL implementation"""
 
-    def test_cache_expires_after_ttl(self):
+    def test_cache_expires_after_ttl(self, monkeypatch):
         """Test that cache entries expire after TTL"""
+        now = [1000.0]
+        monkeypatch.setattr('genesisgraph.did_resolver.time', lambda: now[0])
         resolver = DIDResolver(cache_ttl=1)  # 1 second TTL
 
         # Resolve a did:key (doesn't require network)
         did = 'did:key:z6MkhaXgBZDvotDkL5257faiztiGiC2QtKLGpbnnEGta2doK'
         result1 = resolver.resolve_to_public_key(did)
 
-        # Should be cached
-        assert did in resolver._cache
-
-        # Simulate time passing
-        cached_value, cached_time = resolver._cache[did]
-        resolver._cache[did] = (cached_value, cached_time - 2)  # Expire the cache
+        # Within the TTL the cached entry is served without re-resolving
+        now[0] += 0.5
+        with patch.object(resolver, '_resolve_did_key') as resolve:
+            assert resolver.resolve_to_public_key(did) == result1
+            resolve.assert_not_called()
 
-        # Next resolution should not use expired cache
-        result2 = resolver.resolve_to_public_key(did)
+        # Once the TTL has passed the entry is resolved again
+        now[0] += 2
+        resolve_did_key = resolver._resolve_did_key
+        with patch.object(resolver, '_resolve_did_key', wraps=resolve_did_key) as resolve:
+            result2 = resolver.resolve_to_public_key(did)
+            resolve.assert_called_once_with(did)
 
-        # Results should be same (same DID), but cache was refreshed
         assert result1 == result2
 
 
 class TestDoSProtection:
     """Test DoS protection via input limits"""
 
-    def test_too_many_entities_rejected(self):
+    def test_too_many_entities_rejected(self, validator, too_many_entities_doc):
         """Test that documents with too many entities are rejected"""
-        data = {
-            'spec_version': '0.1.0',
-            'entities': [
-                {
-                    'id': f'entity_{i}',
-                    'type': 'File',
-                    'version': '1',
-                    'uri': f'http://example.com/file{i}'
-                }
-                for i in range(MAX_ENTITIES + 1)
-            ],
-            'operations': [],
-            'tools': []
-        }
-
-        validator = GenesisGraphValidator()
-        result = validator.validate(data)
+        result = validator.validate(too_many_entities_doc)
 
         assert not result.is_valid
-        assert any('too many entities' in err.lower() for err in result.errors)
+        assert _err_contains(result, 'too many entities')
 
-    def test_too_many_operations_rejected(self):
+    def test_too_many_operations_rejected(self, validator, too_many_operations_doc):
         """Test that documents with too many operations are rejected"""
-        data = {
-            'spec_version': '0.1.0',
-            'entities': [],
-            'operations': [
-                {
-                    'id': f'op_{i}',
-                    'type': 'Transform',
-                    'inputs': [],
-                    'outputs': []
-                }
-                for i in range(MAX_OPERATIONS + 1)
-            ],
-            'tools': []
-        }
+        result = validator.validate(too_many_operations_doc)
 
-        validator = GenesisGraphValidator()
-        result = validator.validate(data)
+        assert not result.is_valid
+        assert _err_contains(result, 'too many operations')
+
+    def test_over_limit_document_skips_schema_validation(self, too_many_operations_doc):
+        """Test that schema validation does not walk a document over the limits"""
+        validator = GenesisGraphValidator(use_schema=True)
+
+        with patch.object(validator, '_get_schema_validator') as get_schema_validator:
+            result = validator.validate(too_many_operations_doc)
 
         assert not result.is_valid
-        assert any('too many operations' in err.lower() for err in result.errors)
+        assert _err_contains(result, 'too many operations')
+        get_schema_validator.assert_not_called()
 
-    def test_id_too_long_rejected(self):
+    def test_id_too_long_rejected(self, validator):
         """Test that IDs that are too long are rejected"""
         data = {
             'spec_version': '0.1.0',
             'entities': [
                 {
-                    'id': 'x' * (MAX_ID_LENGTH + 1),
+                    'id': _LONG_ID,
                     'type': 'File',
                     'version': '1',
                     'uri': 'http://example.com/file'
@@ -348,101 +324,71 @@ class TestDoSProtection:
             'tools': []
         }
 
-        validator = GenesisGraphValidator()
         result = validator.validate(data)
 
         assert not result.is_valid
-        assert any('too long' in err.lower() for err in result.errors)
+        assert _err_contains(result, 'too long')
 
-    def test_base58_too_long_rejected(self):
+    def test_base58_too_long_rejected(self, resolver):
         """Test that overly long base58 strings are rejected"""
-        from genesisgraph.did_resolver import MAX_BASE58_LENGTH, DIDResolver
-
-        resolver = DIDResolver()
-        long_base58 = '1' * (MAX_BASE58_LENGTH + 1)
-        malicious_did = f'did:key:z{long_base58}'
+        malicious_did = f'did:key:z{_LONG_B58}'
 
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=_TOO_LONG_RE):
             resolver.resolve_to_public_key(malicious_did)
 
-        assert 'too long' in str(exc_info.value).lower()
-
-    def test_did_too_long_rejected(self):
+    def test_did_too_long_rejected(self, resolver):
         """Test that overly long DIDs are rejected"""
-        from genesisgraph.did_resolver import MAX_DID_LENGTH, DIDResolver
-
-        resolver = DIDResolver()
-        long_did = 'did:key:' + 'z' * (MAX_DID_LENGTH + 1)
-
-        with pytest.raises(ValidationError) as exc_info:
-            resolver.resolve_to_public_key(long_did)
-
-        assert 'too long' in str(exc_info.value).lower()
+        with pytest.raises(ValidationError, match=_TOO_LONG_RE):
+            resolver.resolve_to_public_key(_LONG_DID)
 
 
 class TestContentTypeValidation:
     """Test Content-Type validation for DID web resolution"""
 
     @patch('genesisgraph.did_resolver.requests.get')
-    def test_invalid_content_type_rejected(self, mock_get, mock_http_response):
+    def test_invalid_content_type_rejected(self, mock_get, mock_http_response, resolver):
         """Test that non-JSON content types are rejected"""
         mock_get.return_value = mock_http_response(
             content_type='text/html',
             content=b'<html>Not JSON</html>'
         )
 
-        resolver = DIDResolver()
-
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=_CONTENT_TYPE_RE):
             resolver.resolve_to_public_key('did:web:example.com')
 
-        assert 'content type' in str(exc_info.value).lower()
-
     @patch('genesisgraph.did_resolver.requests.get')
-    def test_valid_content_type_accepted(self, mock_get, mock_http_response):
+    def test_valid_content_type_accepted(self, mock_get, mock_http_response, resolver):
         """Test that valid JSON content types are accepted"""
         mock_get.return_value = mock_http_response(
             json_data={"verificationMethod": []}
         )
 
-        resolver = DIDResolver()
-
         # Should not raise content type error (will raise key not found)
         with pytest.raises(ValidationError) as exc_info:
             resolver.resolve_to_public_key('did:web:example.com')
 
         # Error should be about missing key, not content type
-        assert 'content type' not in str(exc_info.value).lower()
+        assert not _CONTENT_TYPE_RE.search(str(exc_info.value))
 
     @patch('genesisgraph.did_resolver.requests.get')
-    def test_response_size_limit_enforced(self, mock_get, mock_http_response):
+    def test_response_size_limit_enforced(self, mock_get, mock_http_response, resolver):
         """Test that overly large responses are rejected"""
-        from genesisgraph.did_resolver import MAX_RESPONSE_SIZE
-
-        mock_get.return_value = mock_http_response(
-            content=b'x' * (MAX_RESPONSE_SIZE + 1)
-        )
+        mock_get.return_value = mock_http_response(content=_OVERSIZE_PAYLOAD)
 
-        resolver = DIDResolver()
-
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=_TOO_LARGE_RE):
             resolver.resolve_to_public_key('did:web:example.com')
 
-        assert 'too large' in str(exc_info.value).lower()
-
 
 class TestTLSValidation:
     """Test TLS certificate validation"""
 
     @patch('genesisgraph.did_resolver.requests.get')
-    def test_verify_tls_enabled(self, mock_get, mock_http_response):
+    def test_verify_tls_enabled(self, mock_get, mock_http_response, resolver):
         """Test that TLS verification is enabled"""
         mock_get.return_value = mock_http_response(
             json_data={"verificationMethod": []}
         )
 
-        resolver = DIDResolver()
-
         try:
             resolver.resolve_to_public_key('did:web:example.com')
         except ValidationError:
@@ -454,14 +400,12 @@ class TestTLSValidation:
         assert call_kwargs.get('verify') is True
 
     @patch('genesisgraph.did_resolver.requests.get')
-    def test_redirects_disabled(self, mock_get, mock_http_response):
+    def test_redirects_disabled(self, mock_get, mock_http_response, resolver):
         """Test that redirects are disabled"""
         mock_get.return_value = mock_http_response(
             json_data={"verificationMethod": []}
         )
 
-        resolver = DIDResolver()
-
         try:
             resolver.resolve_to_public_key('did:web:example.com')
         except ValidationError:
@@ -9,7 +9,6 @@ Tests cover:
 """
 
 import base64
-import json
 
 import pytest
 from cryptography.hazmat.primitives.asymmetric import ed25519
@@ -18,22 +17,57 @@ from genesisgraph.did_resolver import DIDResolver, resolve_did_to_public_key
 from genesisgraph.errors import ValidationError
 from genesisgraph.validator import GenesisGraphValidator
 
+# Static malformed did:key values (base58btc of the bytes noted)
+# Wrong multicodec: 0xabcd instead of 0xed01, followed by 32 zero bytes
+INVALID_MULTICODEC_DID = "did:key:z4tG5zKYNDVzGk2RCxwHsYigbjyHbAvBR3sCpuhwsM3VnmHh"
+# Too short: only the single byte 0xed
+SHORT_KEY_DID = "did:key:z56"
+
+
+def _has_error(errors, needle: str) -> bool:
+    """True if needle occurs in any error (messages are matched as emitted)"""
+    return needle in '\n'.join(errors)
+
+
+def _signing_message(operation_data) -> bytes:
+    """Bytes signatures are made over: the validator's own canonical JSON"""
+    return GenesisGraphValidator._canonical_json(operation_data).encode('utf-8')
+
+
+def _ed25519_signature(private_key, message: bytes) -> str:
+    """Sign message and format it as an attestation signature ("ed25519:<base64>")"""
+    return (b"ed25519:" + base64.b64encode(private_key.sign(message))).decode('ascii')
+
+
+@pytest.fixture(scope="module")
+def resolver():
+    """DID resolver shared by tests that only resolve did:key (no network or rate limits)"""
+    return DIDResolver()
+
+
+@pytest.fixture(scope="module")
+def signing_identity(base58_encode):
+    """
+    Ed25519 key shared by tests that do not need distinct keys
+
+    Returns:
+        (private_key, public_key_bytes, did) where did is the matching did:key
+    """
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    public_key_bytes = private_key.public_key().public_bytes_raw()
+
+    # Format: did:key:z<base58btc(0xed01 + public_key)>
+    multicodec_key = b'\xed\x01' + public_key_bytes
+    did = f"did:key:z{base58_encode(multicodec_key)}"
+    return private_key, public_key_bytes, did
+
 
 class TestDIDResolver:
     """Tests for DID resolution"""
 
-    def test_resolve_did_key_valid(self):
+    def test_resolve_did_key_valid(self, resolver, signing_identity):
         """Test resolving a valid did:key identifier"""
-        resolver = DIDResolver()
-
-        # Generate a test keypair
-        private_key = ed25519.Ed25519PrivateKey.generate()
-        public_key_bytes = private_key.public_key().public_bytes_raw()
-
-        # Create did:key from public key
-        # Format: did:key:z<base58btc(0xed01 + public_key)>
-        multicodec_key = b'\xed\x01' + public_key_bytes
-        did = f"did:key:z{self._base58_encode(multicodec_key)}"
+        _, public_key_bytes, did = signing_identity
 
         # Resolve DID
         resolved_key = resolver.resolve_to_public_key(did)
@@ -41,76 +75,48 @@ class TestDIDResolver:
         # Should match original public key
         assert resolved_key == public_key_bytes
 
-    def test_resolve_did_key_invalid_multibase(self):
+    def test_resolve_did_key_invalid_multibase(self, resolver):
         """Test did:key with invalid multibase encoding"""
-        resolver = DIDResolver()
-
         # Use 'x' prefix instead of 'z' (unsupported encoding)
         did = "did:key:xInvalidEncoding"
 
         with pytest.raises(ValidationError, match="Unsupported multibase encoding"):
             resolver.resolve_to_public_key(did)
 
-    def test_resolve_did_key_invalid_multicodec(self):
+    def test_resolve_did_key_invalid_multicodec(self, resolver):
         """Test did:key with wrong key type"""
-        resolver = DIDResolver()
-
-        # Create key with wrong multicodec (0xabcd instead of 0xed01)
-        wrong_multicodec = b'\xab\xcd' + b'\x00' * 32
-        did = f"did:key:z{self._base58_encode(wrong_multicodec)}"
-
         with pytest.raises(ValidationError, match="Unsupported key type"):
-            resolver.resolve_to_public_key(did)
+            resolver.resolve_to_public_key(INVALID_MULTICODEC_DID)
 
-    def test_resolve_did_key_too_short(self):
+    def test_resolve_did_key_too_short(self, resolver):
         """Test did:key with insufficient bytes"""
-        resolver = DIDResolver()
-
-        # Create key that's too short
-        short_key = b'\xed'  # Only 1 byte
-        did = f"did:key:z{self._base58_encode(short_key)}"
-
         with pytest.raises(ValidationError, match="did:key too short"):
-            resolver.resolve_to_public_key(did)
+            resolver.resolve_to_public_key(SHORT_KEY_DID)
 
-    def test_resolve_invalid_did_format(self):
+    def test_resolve_invalid_did_format(self, resolver):
         """Test DID without did: prefix"""
-        resolver = DIDResolver()
-
         with pytest.raises(ValidationError, match="Invalid DID format"):
             resolver.resolve_to_public_key("key:z6Mk...")
 
-    def test_resolve_unsupported_method(self):
+    def test_resolve_unsupported_method(self, resolver):
         """Test unsupported DID method"""
-        resolver = DIDResolver()
-
         with pytest.raises(ValidationError, match="Unsupported DID method"):
             resolver.resolve_to_public_key("did:btcr:xxcl-lzpq-q83a-0d5")
 
-    def test_convenience_function(self):
+    def test_convenience_function(self, signing_identity):
         """Test resolve_did_to_public_key convenience function"""
-        # Generate test key
-        private_key = ed25519.Ed25519PrivateKey.generate()
-        public_key_bytes = private_key.public_key().public_bytes_raw()
-
-        # Create did:key
-        multicodec_key = b'\xed\x01' + public_key_bytes
-        did = f"did:key:z{self._base58_encode(multicodec_key)}"
+        _, public_key_bytes, did = signing_identity
 
         # Use convenience function
         resolved = resolve_did_to_public_key(did)
         assert resolved == public_key_bytes
 
-    def test_cache_works(self):
+    def test_cache_works(self, signing_identity):
         """Test that DID resolution caching works"""
+        # Own resolver: this test inspects and clears the cache
         resolver = DIDResolver()
 
-        # Generate test key
-        private_key = ed25519.Ed25519PrivateKey.generate()
-        public_key_bytes = private_key.public_key().public_bytes_raw()
-
-        multicodec_key = b'\xed\x01' + public_key_bytes
-        did = f"did:key:z{self._base58_encode(multicodec_key)}"
+        _, public_key_bytes, did = signing_identity
 
         # First resolution
         result1 = resolver.resolve_to_public_key(did)
@@ -124,46 +130,13 @@ class TestDIDResolver:
         resolver.clear_cache()
         assert len(resolver._cache) == 0
 
-    @staticmethod
-    def _base58_encode(data: bytes) -> str:
-        """Encode bytes to base58btc (for test did:key generation)"""
-        ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-
-        # Convert bytes to integer
-        num = int.from_bytes(data, 'big')
-
-        # Convert to base58
-        if num == 0:
-            return '1'
-
-        result = []
-        while num > 0:
-            num, remainder = divmod(num, 58)
-            result.append(ALPHABET[remainder])
-
-        # Add leading '1's for leading zero bytes
-        for byte in data:
-            if byte == 0:
-                result.append('1')
-            else:
-                break
-
-        return ''.join(reversed(result))
-
 
 class TestSignatureVerification:
     """Tests for Ed25519 signature verification"""
 
-    def test_valid_signature_verification(self):
+    def test_valid_signature_verification(self, signing_identity):
         """Test verification of a valid Ed25519 signature"""
-        # Generate keypair
-        private_key = ed25519.Ed25519PrivateKey.generate()
-        public_key = private_key.public_key()
-        public_key_bytes = public_key.public_bytes_raw()
-
-        # Create did:key from public key
-        multicodec_key = b'\xed\x01' + public_key_bytes
-        did = f"did:key:z{self._base58_encode(multicodec_key)}"
+        private_key, _, did = signing_identity
 
         # Create operation to sign
         operation_data = {
@@ -173,19 +146,16 @@ class TestSignatureVerification:
             "outputs": ["output1"]
         }
 
-        # Compute canonical JSON
-        canonical_json = json.dumps(operation_data, sort_keys=True, separators=(',', ':'))
-        message = canonical_json.encode('utf-8')
+        message = _signing_message(operation_data)
 
         # Sign
-        signature_bytes = private_key.sign(message)
-        signature_b64 = base64.b64encode(signature_bytes).decode('utf-8')
+        signature = _ed25519_signature(private_key, message)
 
         # Create attestation
         attestation = {
             "mode": "signed",
             "signer": did,
-            "signature": f"ed25519:{signature_b64}",
+            "signature": signature,
             "timestamp": "2025-11-17T10:00:00Z"
         }
 
@@ -199,15 +169,9 @@ class TestSignatureVerification:
         # Should have no errors
         assert len(errors) == 0
 
-    def test_invalid_signature_detection(self):
+    def test_invalid_signature_detection(self, signing_identity):
         """Test detection of invalid signature"""
-        # Generate keypair
-        private_key = ed25519.Ed25519PrivateKey.generate()
-        public_key_bytes = private_key.public_key().public_bytes_raw()
-
-        # Create did:key
-        multicodec_key = b'\xed\x01' + public_key_bytes
-        did = f"did:key:z{self._base58_encode(multicodec_key)}"
+        private_key, _, did = signing_identity
 
         # Create operation
         operation_data = {
@@ -219,14 +183,13 @@ class TestSignatureVerification:
 
         # Sign DIFFERENT data
         wrong_message = b"This is the wrong message"
-        signature_bytes = private_key.sign(wrong_message)
-        signature_b64 = base64.b64encode(signature_bytes).decode('utf-8')
+        signature = _ed25519_signature(private_key, wrong_message)
 
         # Create attestation
         attestation = {
             "mode": "signed",
             "signer": did,
-            "signature": f"ed25519:{signature_b64}",
+            "signature": signature,
             "timestamp": "2025-11-17T10:00:00Z"
         }
 
@@ -237,16 +200,11 @@ class TestSignatureVerification:
         errors = validator._validate_attestation(attestation, "op_test", operation_data)
 
         # Should have signature verification error
-        assert any("signature verification failed" in err.lower() for err in errors)
+        assert _has_error(errors, "signature verification failed")
 
-    def test_malformed_signature_base64(self):
+    def test_malformed_signature_base64(self, signing_identity):
         """Test handling of malformed base64 signature"""
-        # Generate keypair for DID
-        private_key = ed25519.Ed25519PrivateKey.generate()
-        public_key_bytes = private_key.public_key().public_bytes_raw()
-
-        multicodec_key = b'\xed\x01' + public_key_bytes
-        did = f"did:key:z{self._base58_encode(multicodec_key)}"
+        did = signing_identity[2]
 
         # Create operation
         operation_data = {
@@ -269,7 +227,7 @@ class TestSignatureVerification:
         )
 
         # Should have decoding error
-        assert any("failed to decode signature" in err.lower() for err in errors)
+        assert _has_error(errors, "failed to decode signature")
 
     def test_mock_signature_accepted(self):
         """Test that mock signatures are accepted for testing"""
@@ -339,25 +297,7 @@ class TestSignatureVerification:
         )
 
         # Should report missing signer
-        assert any("requires 'signer'" in err for err in errors)
-
-    @staticmethod
-    def _base58_encode(data: bytes) -> str:
-        """Encode bytes to base58btc"""
-        ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-        num = int.from_bytes(data, 'big')
-        if num == 0:
-            return '1'
-        result = []
-        while num > 0:
-            num, remainder = divmod(num, 58)
-            result.append(ALPHABET[remainder])
-        for byte in data:
-            if byte == 0:
-                result.append('1')
-            else:
-                break
-        return ''.join(reversed(result))
+        assert _has_error(errors, "requires 'signer'")
 
 
 class TestCanonicalJSON:
@@ -419,15 +359,9 @@ class TestCanonicalJSON:
 class TestIntegrationSignatureVerification:
     """Integration tests for full signature verification workflow"""
 
-    def test_full_document_with_signature(self):
+    def test_full_document_with_signature(self, signing_identity):
         """Test validation of complete document with signed operation"""
-        # Generate keypair
-        private_key = ed25519.Ed25519PrivateKey.generate()
-        public_key_bytes = private_key.public_key().public_bytes_raw()
-
-        # Create did:key
-        multicodec_key = b'\xed\x01' + public_key_bytes
-        did = f"did:key:z{self._base58_encode(multicodec_key)}"
+        private_key, _, did = signing_identity
 
         # Create operation to sign
         operation_data = {
@@ -437,17 +371,14 @@ class TestIntegrationSignatureVerification:
             "outputs": ["gg:file:project:output.txt"]
         }
 
-        # Sign operation
-        canonical_json = json.dumps(operation_data, sort_keys=True, separators=(',', ':'))
-        message = canonical_json.encode('utf-8')
-        signature_bytes = private_key.sign(message)
-        signature_b64 = base64.b64encode(signature_bytes).decode('utf-8')
+        message = _signing_message(operation_data)
+        signature = _ed25519_signature(private_key, message)
 
         # Add attestation
         operation_data["attestation"] = {
             "mode": "signed",
             "signer": did,
-            "signature": f"ed25519:{signature_b64}",
+            "signature": signature,
             "timestamp": "2025-11-17T10:00:00Z"
         }
 
@@ -480,15 +411,9 @@ class TestIntegrationSignatureVerification:
         assert result.is_valid
         assert len(result.errors) == 0
 
-    def test_tampered_document_detection(self):
+    def test_tampered_document_detection(self, signing_identity):
         """Test that tampering with signed document is detected"""
-        # Generate keypair
-        private_key = ed25519.Ed25519PrivateKey.generate()
-        public_key_bytes = private_key.public_key().public_bytes_raw()
-
-        # Create did:key
-        multicodec_key = b'\xed\x01' + public_key_bytes
-        did = f"did:key:z{self._base58_encode(multicodec_key)}"
+        private_key, _, did = signing_identity
 
         # Create and sign operation
         operation_data = {
@@ -498,15 +423,13 @@ class TestIntegrationSignatureVerification:
             "outputs": ["output1"]
         }
 
-        canonical_json = json.dumps(operation_data, sort_keys=True, separators=(',', ':'))
-        message = canonical_json.encode('utf-8')
-        signature_bytes = private_key.sign(message)
-        signature_b64 = base64.b64encode(signature_bytes).decode('utf-8')
+        message = _signing_message(operation_data)
+        signature = _ed25519_signature(private_key, message)
 
         operation_data["attestation"] = {
             "mode": "signed",
             "signer": did,
-            "signature": f"ed25519:{signature_b64}",
+            "signature": signature,
             "timestamp": "2025-11-17T10:00:00Z"
         }
 
@@ -526,22 +449,4 @@ class TestIntegrationSignatureVerification:
 
         # Should detect tampering
         assert not result.is_valid
-        assert any("signature verification failed" in err.lower() for err in result.errors)
-
-    @staticmethod
-    def _base58_encode(data: bytes) -> str:
-        """Encode bytes to base58btc"""
-        ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-        num = int.from_bytes(data, 'big')
-        if num == 0:
-            return '1'
-        result = []
-        while num > 0:
-            num, remainder = divmod(num, 58)
-            result.append(ALPHABET[remainder])
-        for byte in data:
-            if byte == 0:
-                result.append('1')
-            else:
-                break
-        return ''.join(reversed(result))
+        assert _has_error(result.errors, "signature verification failed")
@@ -100,16 +100,9 @@ class TestRFC6962Verifier:
         )
         assert is_valid
 
-    def test_verify_inclusion_proof_four_leaves(self):
+    def test_verify_inclusion_proof_four_leaves(self, four_leaf_tree):
         """Test inclusion proof for a balanced 4-leaf tree"""
-        # Build a 4-leaf tree
-        leaves = [b"leaf_0", b"leaf_1", b"leaf_2", b"leaf_3"]
-        leaf_hashes = [RFC6962Verifier.hash_leaf(leaf) for leaf in leaves]
-
-        # Build tree
-        level1_0 = RFC6962Verifier.hash_children(leaf_hashes[0], leaf_hashes[1])
-        level1_1 = RFC6962Verifier.hash_children(leaf_hashes[2], leaf_hashes[3])
-        root = RFC6962Verifier.hash_children(level1_0, level1_1)
+        leaf_hashes, (level1_0, level1_1), root = four_leaf_tree
 
         # Prove leaf[0] is in the tree
         # Proof path: [leaf_1_hash, level1_1]
@@ -133,6 +126,45 @@ class TestRFC6962Verifier:
         )
         assert is_valid
 
+    def test_verify_inclusion_proof_packed(self, four_leaf_tree):
+        """Test inclusion proof with sibling hashes packed into one buffer"""
+        leaf_hashes, (level1_0, level1_1), root = four_leaf_tree
+
+        assert RFC6962Verifier.verify_inclusion_proof_packed(
+            leaf_hash=leaf_hashes[3],
+            tree_size=4,
+            leaf_index=3,
+            proof_blob=leaf_hashes[2] + level1_0,
+            root_hash=root
+        )
+
+        # Truncated blobs cannot be split into 32-byte nodes
+        with pytest.raises(InvalidProofError):
+            RFC6962Verifier.verify_inclusion_proof_packed(
+                leaf_hash=leaf_hashes[3],
+                tree_size=4,
+                leaf_index=3,
+                proof_blob=leaf_hashes[2] + level1_0[:31],
+                root_hash=root
+            )
+
+    def test_verify_inclusion_proof_rejects_tampered_nodes(self, four_leaf_tree):
+        """Test that a tampered leaf, sibling, or upper node fails verification"""
+        leaf_hashes, (level1_0, level1_1), root = four_leaf_tree
+
+        assert RFC6962Verifier.verify_inclusion_proof(
+            leaf_hashes[1], 4, 1, [leaf_hashes[0], level1_1], root
+        )
+        assert not RFC6962Verifier.verify_inclusion_proof(
+            b'x' * 32, 4, 1, [leaf_hashes[0], level1_1], root
+        )
+        assert not RFC6962Verifier.verify_inclusion_proof(
+            leaf_hashes[1], 4, 1, [b'x' * 32, level1_1], root
+        )
+        assert not RFC6962Verifier.verify_inclusion_proof(
+            leaf_hashes[0], 4, 0, [leaf_hashes[1], b'x' * 32], root
+        )
+
     def test_verify_inclusion_proof_invalid_wrong_root(self):
         """Test that invalid proof fails with wrong root hash"""
         leaf_data = b"test_leaf"
@@ -664,3 +696,13 @@ class TestTransparencyLogEntry:
         assert entry.consistency_proof == 'base64:consistency'
         assert entry.timestamp == 1234567890
         assert entry.root_hash == 'abcd1234'
+
+    def test_transparency_log_entries_share_log_id(self):
+        """Test that entries from the same log share one interned log_id"""
+        # Built at runtime so the two strings start out as distinct objects
+        first_id = ''.join(['did:log:', 'shared'])
+        second_id = ''.join(['did:log:', 'shared'])
+        first = TransparencyLogEntry(first_id, '0x1', 10, 'base64:a')
+        second = TransparencyLogEntry(second_id, '0x2', 10, 'base64:b')
+
+        assert first.log_id is second.log_id
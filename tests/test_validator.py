@@ -1,5 +1,7 @@
 """Tests for GenesisGraph validator"""
 
+import os
+
 import pytest
 
 from genesisgraph import GenesisGraphValidator, validate
@@ -413,6 +415,44 @@ class TestSchemaValidation:
         assert not result.is_valid
         assert any('does not match' in error for error in result.errors)
 
+    def test_schema_validator_compiled_once(self):
+        """Test that the compiled schema validator is reused across validations"""
+        data = {'spec_version': '0.1.0', 'tools': [{'id': 'python', 'type': 'Software'}]}
+
+        validator = GenesisGraphValidator(use_schema=True)
+        validator.validate(data)
+        compiled = validator._schema_validator
+        validator.validate(data)
+
+        assert compiled is not None
+        assert validator._schema_validator is compiled
+
+    def test_schema_shared_across_instances(self):
+        """Test that the parsed and compiled schema is reused by new validators"""
+        data = {'spec_version': '0.1.0'}
+
+        first = GenesisGraphValidator(use_schema=True)
+        first.validate(data)
+        second = GenesisGraphValidator(use_schema=True)
+        second.validate(data)
+
+        assert second.schema is first.schema
+        assert second._schema_validator is first._schema_validator
+
+    def test_schema_reloaded_when_file_changes(self, tmp_path):
+        """Test that editing a schema file invalidates the shared cache"""
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text("type: object\nrequired: [spec_version]\n")
+        first = GenesisGraphValidator(schema_path=str(schema_file), use_schema=True)
+
+        schema_file.write_text("type: object\nrequired: [entities]\n")
+        stat = schema_file.stat()
+        os.utime(schema_file, (stat.st_atime, stat.st_mtime + 10))
+        second = GenesisGraphValidator(schema_path=str(schema_file), use_schema=True)
+
+        assert first.schema['required'] == ['spec_version']
+        assert second.schema['required'] == ['entities']
+
 
 class TestSignatureValidation:
     """Test signature validation"""